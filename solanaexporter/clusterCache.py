@@ -0,0 +1,131 @@
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from exporter.jsonRPCRequest import JsonRPCRequest
+from exporter.jsonRPCResponse import JsonRPCResponse
+from exporter.rpcExporter import RPCExporter
+from prometheus_client import Counter, Gauge
+
+# Required configuration keys for the cache service
+REQUIRED_CONFIG_KEYS = {
+    "rpc_url": "SOLANA_RPC_URL",
+    "public_rpc_url": "SOLANA_PUBLIC_RPC_URL",
+    "exporter_port": "EXPORTER_PORT",
+    "poll_interval": "POLL_INTERVAL",
+    "cluster_cache_path": "CLUSTER_CACHE_PATH",
+}
+
+# Large cluster-level responses shared between exporters, keyed as in the snapshot file.
+# getEpochInfo is small and compared against the live slot, so exporters keep requesting it themselves.
+CLUSTER_CACHE_KEYS = ("vote_accounts", "leader_schedule", "block_production")
+
+DEFAULT_CLUSTER_CACHE_MAX_AGE = 60.0
+
+
+def write_json_atomic(path: str, data: Any, prefix: str = ".tmp-") -> None:
+    """Write ``data`` as JSON to ``path`` atomically.
+
+    The data is written to a temporary file in the same directory and renamed over
+    ``path``, so readers always see either the previous or the new content. The
+    temporary file is removed if writing fails.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=prefix, dir=directory)
+    try:
+        with os.fdopen(fd, "w") as tmp_file:
+            json.dump(data, tmp_file, separators=(",", ":"))
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def write_cluster_cache(path: str, data: Dict[str, Any]) -> None:
+    """Atomically publish a cluster data snapshot."""
+    write_json_atomic(path, data, prefix=".cluster-cache-")
+
+
+def read_cluster_cache(path: str, max_age: float, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """Return the cached cluster data, or None if the cache is missing, stale or malformed."""
+    try:
+        with open(path) as cache_file:
+            data = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or any(key not in data for key in CLUSTER_CACHE_KEYS):
+        return None
+
+    timestamp = data.get("timestamp")
+    if not isinstance(timestamp, (int, float)):
+        return None
+    if (time.time() if now is None else now) - timestamp > max_age:
+        return None
+    return data
+
+
+class ClusterCacheService(RPCExporter):
+    """Fetch cluster-level data once per interval and publish it for local exporters."""
+
+    def __init__(self, config_source: str, config_file: Optional[str] = None):
+        super().__init__(
+            config_source=config_source,
+            config_file=config_file,
+            config_keys=REQUIRED_CONFIG_KEYS,
+            required_keys=REQUIRED_CONFIG_KEYS,
+        )
+
+        self.last_publish = Gauge(
+            "solana_cluster_cache_last_publish_timestamp",
+            "Unix time of the last published cluster data snapshot",
+            registry=self.registry,
+        )
+        self.publish_failures = Counter(
+            "solana_cluster_cache_publish_failures",
+            "Number of polls that did not publish a cluster data snapshot",
+            registry=self.registry,
+        )
+
+    def collect_metrics(self):
+        """Fetch cluster data in one batch and publish it as a snapshot."""
+        rpc_requests: List[JsonRPCRequest] = [
+            JsonRPCRequest("getVoteAccounts"),
+            JsonRPCRequest("getLeaderSchedule"),
+            JsonRPCRequest("getBlockProduction"),
+        ]
+
+        responses: List[JsonRPCResponse] = self._batched_rpc_call(rpc_requests)
+        if not responses or len(responses) != len(rpc_requests):
+            self.logger.error("RPC call failed or incomplete batch, keeping previous cluster snapshot")
+            self.publish_failures.inc()
+            return
+
+        data: Dict[str, Any] = {"timestamp": time.time()}
+        for key, request, response in zip(CLUSTER_CACHE_KEYS, rpc_requests, responses):
+            if response.error:
+                self.logger.error(f"Error in RPC response for method {request.method}: {response.error}")
+                self.publish_failures.inc()
+                return
+            data[key] = response.result
+
+        try:
+            write_cluster_cache(self.config.cluster_cache_path, data)
+        except OSError as e:
+            self.logger.error(f"Failed to publish cluster snapshot to {self.config.cluster_cache_path}: {e}")
+            self.publish_failures.inc()
+            return
+
+        self.last_publish.set(data["timestamp"])
+        self.logger.debug(f"Published cluster snapshot to {self.config.cluster_cache_path}")
+
+
+if __name__ == "__main__":
+    configFile: Optional[str] = os.getenv("EXPORTER_ENV")
+    print(f"starting solana cluster cache -- config {configFile}")
+    service = ClusterCacheService(config_source="fromFile", config_file=configFile)
+    service.start_exporter()
@@ -0,0 +1,99 @@
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+
+class NodeEntry(NamedTuple):
+    """Gossip fields of a cluster node that are exported."""
+
+    version: str
+    gossip: str
+    tpu: str
+    rpc: str
+
+
+def node_entry(node: Dict[str, Any]) -> NodeEntry:
+    """Extract the exported fields from a ``getClusterNodes`` entry."""
+    return NodeEntry(
+        version=node.get("version") or "unknown",
+        gossip=node.get("gossip") or "",
+        tpu=node.get("tpu") or "",
+        rpc=node.get("rpc") or "",
+    )
+
+
+class ClusterNodesTracker:
+    """Index cluster nodes and stake by identity pubkey and apply only what changed.
+
+    Per-version node counts and stake are maintained incrementally: every refresh moves the
+    contribution of added, removed or changed nodes only, and reports which versions were
+    touched, so metric updates follow the churn rather than the cluster size. Stake is kept
+    in lamports so the incremental sums stay exact.
+    """
+
+    def __init__(self, identity: str):
+        self.identity = identity
+        self.nodes: Dict[str, NodeEntry] = {}
+        self.stakes: Dict[str, int] = {}
+        self.total_stake = 0
+        self.version_nodes: Dict[str, int] = {}
+        self.version_stake: Dict[str, int] = {}
+        self.changed_versions: Set[str] = set()
+        self.identity_changed = False
+
+    def _add_to_version(self, version: str, nodes: int, stake: int) -> None:
+        self.version_nodes[version] = self.version_nodes.get(version, 0) + nodes
+        self.version_stake[version] = self.version_stake.get(version, 0) + stake
+        if self.version_nodes[version] <= 0:
+            del self.version_nodes[version]
+            del self.version_stake[version]
+        self.changed_versions.add(version)
+
+    def update_nodes(self, cluster_nodes: List[Dict[str, Any]]) -> int:
+        """Apply a ``getClusterNodes`` response and return the number of changed nodes."""
+        current = {node["pubkey"]: node_entry(node) for node in cluster_nodes if node.get("pubkey")}
+        churn = 0
+
+        for pubkey in self.nodes.keys() - current.keys():
+            old = self.nodes.pop(pubkey)
+            self._add_to_version(old.version, -1, -self.stakes.get(pubkey, 0))
+            self.identity_changed |= pubkey == self.identity
+            churn += 1
+
+        for pubkey, entry in current.items():
+            old_entry: Optional[NodeEntry] = self.nodes.get(pubkey)
+            if old_entry == entry:
+                continue
+            stake = self.stakes.get(pubkey, 0)
+            if old_entry is not None:
+                self._add_to_version(old_entry.version, -1, -stake)
+            self._add_to_version(entry.version, 1, stake)
+            self.nodes[pubkey] = entry
+            self.identity_changed |= pubkey == self.identity
+            churn += 1
+        return churn
+
+    def update_stakes(self, vote_accounts: Dict[str, Any]) -> int:
+        """Apply a ``getVoteAccounts`` response and return the number of identities whose stake changed."""
+        current: Dict[str, int] = {}
+        for account in vote_accounts.get("current", []) + vote_accounts.get("delinquent", []):
+            node_pubkey = account.get("nodePubkey")
+            if node_pubkey:
+                current[node_pubkey] = current.get(node_pubkey, 0) + account.get("activatedStake", 0)
+
+        changed = 0
+        for pubkey in self.stakes.keys() | current.keys():
+            delta = current.get(pubkey, 0) - self.stakes.get(pubkey, 0)
+            if delta == 0:
+                continue
+            self.total_stake += delta
+            if pubkey in self.nodes:
+                self._add_to_version(self.nodes[pubkey].version, 0, delta)
+            changed += 1
+        self.stakes = current
+        return changed
+
+    def pop_changes(self) -> Tuple[Set[str], bool]:
+        """Return the versions touched and whether our node changed since the last call."""
+        changes = (self.changed_versions, self.identity_changed)
+        self.changed_versions = set()
+        self.identity_changed = False
+        return changes
@@ -0,0 +1,267 @@
+import argparse
+import json
+import logging
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from exporter.jsonRPCRequest import JsonRPCRequest
+from exporter.jsonRPCResponse import JsonRPCResponse
+
+from solanaexporter.clusterCache import write_json_atomic
+
+# Slots in the first warmup epoch, doubling each epoch until the normal epoch length
+MINIMUM_SLOTS_PER_EPOCH = 32
+
+
+class BackfillError(Exception):
+    """Raised when an RPC call needed for the backfill fails."""
+
+
+def epoch_slot_range(epoch_schedule: Dict[str, Any], epoch: int) -> Tuple[int, int]:
+    """Return the first and last slot of ``epoch`` as described by ``getEpochSchedule``."""
+    first_normal_epoch = epoch_schedule["firstNormalEpoch"]
+    if epoch < first_normal_epoch:
+        first_slot = (2**epoch - 1) * MINIMUM_SLOTS_PER_EPOCH
+        return first_slot, first_slot + 2**epoch * MINIMUM_SLOTS_PER_EPOCH - 1
+
+    slots_per_epoch = epoch_schedule["slotsPerEpoch"]
+    first_slot = epoch_schedule["firstNormalSlot"] + (epoch - first_normal_epoch) * slots_per_epoch
+    return first_slot, first_slot + slots_per_epoch - 1
+
+
+class EpochBackfill:
+    """Collect per-epoch leader slots, skips, credits and stake for one validator."""
+
+    def __init__(
+        self,
+        rpc_url: str,
+        validator_pubkey: str,
+        vote_pubkey: str,
+        checkpoint_dir: str,
+        logger: logging.Logger,
+        concurrency: int = 4,
+    ):
+        self.rpc_url = rpc_url
+        self.validator_pubkey = validator_pubkey
+        self.vote_pubkey = vote_pubkey
+        self.checkpoint_dir = checkpoint_dir
+        self.logger = logger
+        self.concurrency = concurrency
+
+    def _call(self, request: JsonRPCRequest) -> Any:
+        """Send a single request and return its result."""
+        responses: List[JsonRPCResponse] = JsonRPCRequest.send(
+            rpc_url=self.rpc_url, rpc_requests=request, logger=self.logger
+        )
+        if not responses:
+            raise BackfillError(f"No response for method {request.method}")
+        if responses[0].error:
+            raise BackfillError(f"Error in RPC response for method {request.method}: {responses[0].error}")
+        return responses[0].result
+
+    def _checkpoint_path(self, epoch: int) -> str:
+        # Checkpoints of different validators can share a directory without being mixed up
+        return os.path.join(self.checkpoint_dir, f"epoch-{epoch}-{self.validator_pubkey}-{self.vote_pubkey}.json")
+
+    def _load_checkpoint(self, epoch: int) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._checkpoint_path(epoch)) as checkpoint_file:
+                row = json.load(checkpoint_file)
+        except (OSError, ValueError):
+            return None
+        if row.get("validator_pubkey") != self.validator_pubkey or row.get("vote_pubkey") != self.vote_pubkey:
+            self.logger.warning(f"Ignoring checkpoint of epoch {epoch} written for another validator")
+            return None
+        return row
+
+    def _save_checkpoint(self, row: Dict[str, Any]) -> None:
+        write_json_atomic(self._checkpoint_path(row["epoch"]), row, prefix=".epoch-")
+
+    def _vote_account_history(self) -> Tuple[Dict[int, int], Optional[float]]:
+        """Return credits earned per epoch and the current activated stake in SOL."""
+        vote_accounts = self._call(
+            JsonRPCRequest(
+                "getVoteAccounts", params=[{"votePubkey": self.vote_pubkey, "keepUnstakedDelinquents": True}]
+            )
+        )
+        for account in vote_accounts.get("current", []) + vote_accounts.get("delinquent", []):
+            if account.get("votePubkey") == self.vote_pubkey:
+                credits = {ec[0]: ec[1] - ec[2] for ec in account.get("epochCredits", []) if len(ec) == 3}
+                return credits, account.get("activatedStake", 0) / 1_000_000_000
+        self.logger.warning(f"Vote account {self.vote_pubkey} not found, credits and stake will be missing")
+        return {}, None
+
+    def fetch_epoch(self, epoch: int, first_slot: int, last_slot: int) -> Dict[str, Any]:
+        """Fetch block production and leader slots of the validator for one epoch."""
+        block_production = self._call(
+            JsonRPCRequest(
+                "getBlockProduction",
+                params=[{"identity": self.validator_pubkey, "range": {"firstSlot": first_slot, "lastSlot": last_slot}}],
+            )
+        )
+        leader_slots, blocks_produced = (
+            block_production.get("value", {}).get("byIdentity", {}).get(self.validator_pubkey, [0, 0])
+        )
+
+        # Leader schedules are only kept for recent epochs, older ones come back as null. A failed
+        # call is recorded separately, so it is not mistaken for an epoch without leader slots.
+        leader_schedule_failed = False
+        try:
+            schedule = self._call(
+                JsonRPCRequest("getLeaderSchedule", params=[first_slot, {"identity": self.validator_pubkey}])
+            )
+        except BackfillError as e:
+            self.logger.warning(f"Leader schedule for epoch {epoch} could not be fetched: {e}")
+            schedule = None
+            leader_schedule_failed = True
+        leader_slot_offsets = (schedule or {}).get(self.validator_pubkey, [])
+
+        return {
+            "epoch": epoch,
+            "validator_pubkey": self.validator_pubkey,
+            "vote_pubkey": self.vote_pubkey,
+            "fetched": True,
+            "leader_schedule_failed": leader_schedule_failed,
+            "first_slot": first_slot,
+            "last_slot": last_slot,
+            "leader_slots": leader_slots,
+            "blocks_produced": blocks_produced,
+            "leader_slot_offsets": leader_slot_offsets,
+        }
+
+    def run(self, start_epoch: int, end_epoch: int, output: str) -> List[int]:
+        """Backfill epochs ``start_epoch`` to ``end_epoch`` inclusive and write them to ``output``.
+
+        Completed epochs are checkpointed, so an interrupted run resumes where it stopped. Epochs
+        that could not be fetched are written as rows with ``fetched`` unset.
+
+        Returns:
+            The epochs that could not be fetched.
+        """
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        epoch_schedule = self._call(JsonRPCRequest("getEpochSchedule"))
+        epoch_info = self._call(JsonRPCRequest("getEpochInfo"))
+        current_epoch, current_slot = epoch_info["epoch"], epoch_info["absoluteSlot"]
+        end_epoch = min(end_epoch, current_epoch)
+
+        rows: Dict[int, Dict[str, Any]] = {}
+        pending: List[Tuple[int, int, int]] = []
+        for epoch in range(start_epoch, end_epoch + 1):
+            checkpoint = self._load_checkpoint(epoch)
+            if checkpoint is not None:
+                rows[epoch] = checkpoint
+                continue
+            first_slot, last_slot = epoch_slot_range(epoch_schedule, epoch)
+            pending.append((epoch, first_slot, min(last_slot, current_slot)))
+        self.logger.info(f"Backfilling {len(pending)} epochs, {len(rows)} restored from checkpoints")
+
+        # Vote accounts only report credits for recent epochs, so they are stored with each checkpoint
+        credits, activated_stake = self._vote_account_history()
+
+        def fetch(task: Tuple[int, int, int]) -> Dict[str, Any]:
+            try:
+                return self.fetch_epoch(*task)
+            except BackfillError as e:
+                self.logger.error(f"Failed to backfill epoch {task[0]}: {e}")
+                epoch, first_slot, last_slot = task
+                return {
+                    "epoch": epoch,
+                    "validator_pubkey": self.validator_pubkey,
+                    "vote_pubkey": self.vote_pubkey,
+                    "fetched": False,
+                    "leader_schedule_failed": True,
+                    "first_slot": first_slot,
+                    "last_slot": last_slot,
+                    "leader_slots": -1,
+                    "blocks_produced": -1,
+                    "leader_slot_offsets": [],
+                }
+
+        missing: List[int] = []
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for row in executor.map(fetch, pending):
+                row["credits"] = credits.get(row["epoch"], -1)
+                row["activated_stake"] = activated_stake if row["epoch"] == current_epoch else None
+                rows[row["epoch"]] = row
+                if not row["fetched"]:
+                    missing.append(row["epoch"])
+                # Failed calls are retried and the running epoch is fetched again on the next run
+                if row["fetched"] and not row["leader_schedule_failed"] and row["epoch"] < current_epoch:
+                    self._save_checkpoint(row)
+
+        self.write_archive(output, [rows[epoch] for epoch in sorted(rows)])
+        return missing
+
+    @staticmethod
+    def write_archive(output: str, rows: List[Dict[str, Any]]) -> None:
+        """Write the epoch rows as a compressed columnar NumPy archive.
+
+        Leader slot offsets are stored flattened, with ``leader_slot_index[i]:leader_slot_index[i + 1]``
+        selecting the offsets of the i-th epoch. Missing credits are -1 and missing stake is NaN,
+        since ``getVoteAccounts`` only reports recent credits and the current stake. Epochs that
+        could not be fetched have ``fetched`` unset and -1 for their block production columns.
+        """
+        fetched = np.array([row.get("fetched", True) for row in rows], dtype=bool)
+        leader_slots = np.array([row["leader_slots"] for row in rows], dtype=np.int64)
+        blocks_produced = np.array([row["blocks_produced"] for row in rows], dtype=np.int64)
+        offsets = [row["leader_slot_offsets"] for row in rows]
+        stakes = [row.get("activated_stake") for row in rows]
+
+        np.savez_compressed(
+            output,
+            epoch=np.array([row["epoch"] for row in rows], dtype=np.int64),
+            first_slot=np.array([row["first_slot"] for row in rows], dtype=np.int64),
+            last_slot=np.array([row["last_slot"] for row in rows], dtype=np.int64),
+            fetched=fetched,
+            leader_slots=leader_slots,
+            blocks_produced=blocks_produced,
+            skipped_slots=np.where(fetched, leader_slots - blocks_produced, -1),
+            leader_schedule_failed=np.array([row.get("leader_schedule_failed", False) for row in rows], dtype=bool),
+            credits=np.array([row.get("credits", -1) for row in rows], dtype=np.int64),
+            activated_stake=np.array([math.nan if stake is None else stake for stake in stakes], dtype=np.float64),
+            leader_slot_index=np.cumsum([0] + [len(epoch_offsets) for epoch_offsets in offsets], dtype=np.int64),
+            leader_slot_offsets=np.array(
+                [offset for epoch_offsets in offsets for offset in epoch_offsets], dtype=np.int64
+            ),
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the epoch backfill from the command line."""
+    parser = argparse.ArgumentParser(description="Backfill past epochs of a Solana validator into a .npz archive.")
+    parser.add_argument("--rpc-url", default=os.getenv("SOLANA_RPC_URL"), help="RPC endpoint with ledger history")
+    parser.add_argument("--validator-pubkey", default=os.getenv("VALIDATOR_PUBKEY"))
+    parser.add_argument("--vote-pubkey", default=os.getenv("VOTE_PUBKEY"))
+    parser.add_argument("--start-epoch", type=int, required=True)
+    parser.add_argument("--end-epoch", type=int, required=True)
+    parser.add_argument("--output", required=True, help="Path of the .npz archive to write")
+    parser.add_argument("--checkpoint-dir", default=".backfill-checkpoints")
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args(argv)
+    if not (args.rpc_url and args.validator_pubkey and args.vote_pubkey):
+        parser.error("--rpc-url, --validator-pubkey and --vote-pubkey are required")
+
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+    backfill = EpochBackfill(
+        rpc_url=args.rpc_url,
+        validator_pubkey=args.validator_pubkey,
+        vote_pubkey=args.vote_pubkey,
+        checkpoint_dir=args.checkpoint_dir,
+        logger=logging.getLogger("solana_backfill"),
+        concurrency=max(1, args.concurrency),
+    )
+    missing = backfill.run(args.start_epoch, args.end_epoch, args.output)
+    if missing:
+        parser.exit(
+            1,
+            f"wrote {args.output} with {len(missing)} epochs that could not be fetched: "
+            f"{', '.join(map(str, missing))}\n",
+        )
+    print(f"wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import gzip
+import logging
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional, Tuple
+from urllib.parse import quote
+
+import requests
+from prometheus_client.exposition import CONTENT_TYPE_LATEST
+
+DEFAULT_PUSH_JOB = "solana_exporter"
+DEFAULT_PUSH_BUFFER = 10
+DEFAULT_PUSH_RETRIES = 3
+DEFAULT_PUSH_BACKOFF = 1.0
+DEFAULT_PUSH_TIMEOUT = 10.0
+
+
+class MetricsPusher:
+    """Push exposition snapshots to a Prometheus Pushgateway from a background thread.
+
+    Snapshots are queued in a bounded buffer, so a slow or unreachable receiver never blocks
+    the collection loop. The Pushgateway only keeps the latest push of a group, so a backlog
+    is coalesced into its newest snapshot, which is sent gzip-compressed with bounded retries
+    and exponential backoff.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        job: str,
+        instance: str,
+        logger: logging.Logger,
+        max_buffer: int = DEFAULT_PUSH_BUFFER,
+        max_retries: int = DEFAULT_PUSH_RETRIES,
+        backoff: float = DEFAULT_PUSH_BACKOFF,
+        timeout: float = DEFAULT_PUSH_TIMEOUT,
+    ):
+        self.url = f"{url.rstrip('/')}/metrics/job/{quote(job, safe='')}/instance/{quote(instance, safe='')}"
+        self.logger = logger
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+        self.last_latency = 0.0
+        self.pushes = 0
+        self.failures = 0
+        self.dropped = 0
+
+        self._buffer: Deque[Tuple[float, bytes]] = deque(maxlen=max_buffer)
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def buffer_depth(self) -> int:
+        """Number of snapshots waiting to be pushed."""
+        return len(self._buffer)
+
+    def enqueue(self, payload: bytes) -> None:
+        """Queue an exposition snapshot, dropping the oldest one when the buffer is full."""
+        with self._condition:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.dropped += 1
+            self._buffer.append((time.time(), payload))
+            self._condition.notify()
+
+    def _take(self) -> Optional[bytes]:
+        """Wait for queued snapshots and return the newest, discarding the older ones."""
+        with self._condition:
+            while not self._buffer and not self._stop.is_set():
+                self._condition.wait()
+            if not self._buffer:
+                return None
+            self.dropped += len(self._buffer) - 1
+            _, payload = self._buffer.pop()
+            self._buffer.clear()
+            return payload
+
+    def push(self, payload: bytes) -> bool:
+        """Send one snapshot, retrying with exponential backoff."""
+        body = gzip.compress(payload)
+        headers = {"Content-Type": CONTENT_TYPE_LATEST, "Content-Encoding": "gzip"}
+        for attempt in range(self.max_retries + 1):
+            started = time.monotonic()
+            try:
+                response = requests.put(self.url, data=body, headers=headers, timeout=self.timeout)
+                response.raise_for_status()
+            except requests.RequestException as e:
+                self.logger.warning(f"Push to {self.url} failed (attempt {attempt + 1}): {e}")
+                if attempt < self.max_retries and not self._stop.wait(self.backoff * 2**attempt):
+                    continue
+                self.failures += 1
+                return False
+            self.last_latency = time.monotonic() - started
+            self.pushes += 1
+            self.logger.debug(f"Pushed {len(body)} bytes to {self.url} in {self.last_latency:.3f}s")
+            return True
+        return False
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            payload = self._take()
+            if payload is not None:
+                self.push(payload)
+
+    def start(self) -> None:
+        """Push queued snapshots in a background thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="metrics-pusher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread after the current push."""
+        self._stop.set()
+        with self._condition:
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,256 @@
+import cProfile
+import io
+import logging
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+PROFILE_MODES = ("cprofile", "stack", "tracemalloc")
+DEFAULT_SAMPLE_INTERVAL = 0.005
+DEFAULT_TOP = 25
+MAX_PROFILED_POLLS = 100
+
+
+class ProfileJob:
+    """Profile state of one request covering ``polls`` collection polls."""
+
+    def __init__(self, polls: int, mode: str, sample_interval: float, top: int):
+        self.polls = polls
+        self.mode = mode
+        self.sample_interval = sample_interval
+        self.top = top
+        self.polls_done = 0
+        self.done = threading.Event()
+
+        self.profile = cProfile.Profile() if mode == "cprofile" else None
+        self.stacks: Counter = Counter()
+        self.phase = "poll"
+        self._sampling = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._poll_thread_id = 0
+        self.started_tracemalloc = False
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self.phase_allocations: Dict[str, List[tracemalloc.StatisticDiff]] = {}
+
+    def begin(self) -> None:
+        self.phase = "poll"
+        if self.profile is not None:
+            self.profile.enable()
+        elif self.mode == "stack":
+            self._poll_thread_id = threading.get_ident()
+            self._sampling.set()
+            self._sampler = threading.Thread(target=self._sample, name="poll-profiler-sampler", daemon=True)
+            self._sampler.start()
+        elif self.mode == "tracemalloc":
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.started_tracemalloc = True
+            self._snapshot = tracemalloc.take_snapshot()
+
+    def mark(self, phase: str) -> None:
+        """Close the running phase and start ``phase``."""
+        if self.mode == "tracemalloc":
+            self._record_allocations()
+        self.phase = phase
+
+    def end(self) -> None:
+        if self.profile is not None:
+            self.profile.disable()
+        elif self.mode == "stack":
+            self._sampling.clear()
+            if self._sampler is not None:
+                self._sampler.join()
+                self._sampler = None
+        elif self.mode == "tracemalloc":
+            self._record_allocations()
+            self._snapshot = None
+        self.polls_done += 1
+
+    def finish(self) -> None:
+        """Release resources held for the profile."""
+        if self.started_tracemalloc:
+            tracemalloc.stop()
+            self.started_tracemalloc = False
+
+    def _sample(self) -> None:
+        while self._sampling.is_set():
+            frame = sys._current_frames().get(self._poll_thread_id)  # pylint: disable=protected-access
+            if frame is not None:
+                stack = []
+                while frame is not None:
+                    stack.append(f"{frame.f_code.co_filename.rsplit('/', 1)[-1]}:{frame.f_code.co_name}")
+                    frame = frame.f_back
+                self.stacks[(self.phase, ";".join(reversed(stack)))] += 1
+            self._sampling.wait(self.sample_interval)
+
+    def _record_allocations(self) -> None:
+        if self._snapshot is None or not tracemalloc.is_tracing():
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        )
+        diff = snapshot.compare_to(self._snapshot, "lineno")
+        self.phase_allocations.setdefault(self.phase, []).extend(diff)
+        self._snapshot = snapshot
+
+    def report(self) -> str:
+        """Render the collected profile as text."""
+        out = io.StringIO()
+        out.write(f"# {self.mode} profile of {self.polls_done} collect_metrics poll(s)\n")
+        if self.profile is not None:
+            pstats.Stats(self.profile, stream=out).sort_stats("cumulative").print_stats(self.top)
+        elif self.mode == "stack":
+            total = sum(self.stacks.values())
+            out.write(f"# {total} samples every {self.sample_interval * 1000:.1f}ms, as phase;stack count\n")
+            for (phase, stack), count in self.stacks.most_common(self.top):
+                out.write(f"{phase};{stack} {count}\n")
+        else:
+            for phase, diffs in self.phase_allocations.items():
+                by_line: Counter = Counter()
+                for stat in diffs:
+                    by_line[str(stat.traceback)] += stat.size_diff
+                out.write(f"\n## {phase}: {sum(by_line.values()) / 1024:+.1f} KiB\n")
+                for line, size in by_line.most_common(self.top):
+                    out.write(f"{size / 1024:+10.1f} KiB  {line}\n")
+        return out.getvalue()
+
+
+class PollProfiler:
+    """Profile upcoming collection polls on request.
+
+    The exporter checks :attr:`active` before every call, so an idle profiler costs a single
+    attribute read per phase mark.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        sample_interval: float = DEFAULT_SAMPLE_INTERVAL,
+        top: int = DEFAULT_TOP,
+    ):
+        self.logger = logger
+        self.sample_interval = sample_interval
+        self.top = top
+        self.active = False
+        self._job: Optional[ProfileJob] = None
+        self._current: Optional[ProfileJob] = None
+        self._lock = threading.Lock()
+
+    def run(self, polls: int, mode: str, timeout: float) -> str:
+        """Profile the next ``polls`` polls and return the report.
+
+        Raises:
+            ValueError: If the mode or poll count is invalid.
+            RuntimeError: If another profile is already running.
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode {mode}, expected one of {', '.join(PROFILE_MODES)}")
+        if not 1 <= polls <= MAX_PROFILED_POLLS:
+            raise ValueError(f"polls must be between 1 and {MAX_PROFILED_POLLS}")
+
+        job = ProfileJob(polls, mode, self.sample_interval, self.top)
+        with self._lock:
+            if self._job is not None:
+                raise RuntimeError("A profile is already running")
+            self._job = job
+            self.active = True
+        self.logger.info(f"Profiling the next {polls} poll(s) with {mode}")
+
+        finished = job.done.wait(timeout)
+        with self._lock:
+            self._job = None
+            self.active = False
+            in_flight = self._current is job
+        if finished:
+            return job.report()
+
+        self.logger.warning(f"Profile timed out after {job.polls_done} of {polls} poll(s)")
+        if not in_flight:
+            job.finish()
+            return job.report()
+        # The detached job is finished by end_poll of the running poll, its data is only read after that
+        if not job.done.wait(timeout):
+            return f"# {mode} profile timed out with a poll still running after {job.polls_done} of {polls} poll(s)\n"
+        return job.report()
+
+    def begin_poll(self) -> None:
+        """Start profiling a poll if a profile was requested."""
+        with self._lock:
+            job = self._job
+            if job is None or job.done.is_set():
+                return
+            self._current = job
+        job.begin()
+
+    def mark(self, phase: str) -> None:
+        """Attribute the rest of the running poll to ``phase``."""
+        if self._current is not None:
+            self._current.mark(phase)
+
+    def end_poll(self) -> None:
+        """Stop profiling the running poll."""
+        job = self._current
+        if job is None:
+            return
+        job.end()
+        with self._lock:
+            self._current = None
+            detached = self._job is not job
+        if job.polls_done >= job.polls or detached:
+            job.finish()
+            job.done.set()
+
+
+class ProfilingHandler(BaseHTTPRequestHandler):
+    """Serve ``GET /debug/profile?polls=N&mode=cprofile|stack|tracemalloc``."""
+
+    server: "ProfilingServer"
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != "/debug/profile":
+            self._reply(404, "Not found\n")
+            return
+        query = parse_qs(url.query)
+        try:
+            polls = int(query.get("polls", ["1"])[0])
+            mode = query.get("mode", ["cprofile"])[0]
+            report = self.server.profiler.run(polls, mode, timeout=polls * self.server.poll_timeout)
+        except ValueError as e:
+            self._reply(400, f"{e}\n")
+            return
+        except RuntimeError as e:
+            self._reply(409, f"{e}\n")
+            return
+        self._reply(200, report)
+
+    def _reply(self, status: int, body: str) -> None:
+        data = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        self.server.profiler.logger.debug(format % args)
+
+
+class ProfilingServer(ThreadingHTTPServer):
+    """Debug HTTP server exposing a :class:`PollProfiler`."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], profiler: PollProfiler, poll_timeout: float):
+        super().__init__(address, ProfilingHandler)
+        self.profiler = profiler
+        self.poll_timeout = poll_timeout
+
+    def start(self) -> None:
+        """Serve requests in a background thread."""
+        threading.Thread(target=self.serve_forever, name="poll-profiler-http", daemon=True).start()
@@ -0,0 +1,133 @@
+import logging
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+import requests
+
+# Target slot duration of the Solana cluster in seconds
+SLOT_DURATION = 0.4
+DEFAULT_REFERENCE_POLL_INTERVAL = 2.0
+DEFAULT_REFERENCE_TIMEOUT = 1.0
+# Samples further than this many slots from the upper median are dropped as outliers
+DEFAULT_MAX_DEVIATION = 150
+
+
+def consensus_tip(
+    samples: Sequence[Tuple[int, float]],
+    now: float,
+    slot_duration: float = SLOT_DURATION,
+    max_deviation: float = DEFAULT_MAX_DEVIATION,
+) -> Optional[Tuple[float, int]]:
+    """Combine (slot, timestamp) samples into a cluster tip at ``now``.
+
+    Every sample is projected forward to ``now`` so that slower responses are comparable,
+    samples too far from the upper median are dropped, and the highest remaining slot is taken
+    since lagging endpoints only ever understate the tip. The upper median is itself a sample,
+    so at least one sample always survives, even when two endpoints disagree widely.
+
+    Returns:
+        The consensus tip and the number of samples it was built from, or None without samples.
+    """
+    if not samples:
+        return None
+    aligned = [slot + max(0.0, now - timestamp) / slot_duration for slot, timestamp in samples]
+    median = statistics.median_high(aligned)
+    inliers = [slot for slot in aligned if abs(slot - median) <= max_deviation]
+    return max(inliers), len(inliers)
+
+
+class ReferenceTipTracker:
+    """Track the cluster tip by polling several reference RPC endpoints concurrently."""
+
+    def __init__(
+        self,
+        endpoints: List[str],
+        logger: logging.Logger,
+        interval: float = DEFAULT_REFERENCE_POLL_INTERVAL,
+        timeout: float = DEFAULT_REFERENCE_TIMEOUT,
+        max_deviation: float = DEFAULT_MAX_DEVIATION,
+    ):
+        self.endpoints = endpoints
+        self.logger = logger
+        self.interval = interval
+        self.timeout = timeout
+        self.max_deviation = max_deviation
+        self.endpoints_used = 0
+
+        self._tip: Optional[Tuple[float, float]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._executor = ThreadPoolExecutor(max_workers=len(endpoints), thread_name_prefix="reference-tip")
+
+    def _query_endpoint(self, url: str) -> Optional[Tuple[int, float]]:
+        """Return the slot reported by one endpoint with the time it was observed."""
+        started = time.time()
+        try:
+            response = requests.post(url, json={"jsonrpc": "2.0", "id": 1, "method": "getSlot"}, timeout=self.timeout)
+            response.raise_for_status()
+            slot = response.json().get("result")
+        except (requests.RequestException, ValueError, AttributeError) as e:
+            self.logger.debug(f"Reference endpoint {url} failed: {e}")
+            return None
+        if not isinstance(slot, int):
+            self.logger.debug(f"Reference endpoint {url} returned no slot")
+            return None
+        # The slot was read somewhere during the request, the midpoint is the best estimate
+        return slot, (started + time.time()) / 2
+
+    def poll(self) -> Optional[float]:
+        """Query all endpoints once and update the consensus tip."""
+        futures = [self._executor.submit(self._query_endpoint, url) for url in self.endpoints]
+        samples = [sample for sample in (future.result() for future in futures) if sample is not None]
+        now = time.time()
+        consensus = consensus_tip(samples, now, max_deviation=self.max_deviation)
+        if consensus is None:
+            self.logger.warning("No reference endpoint returned a slot")
+            return None
+
+        tip, endpoints_used = consensus
+        with self._lock:
+            self._tip = (tip, now)
+            self.endpoints_used = endpoints_used
+        self.logger.debug(f"Updated reference tip: {tip:.0f} from {endpoints_used}/{len(self.endpoints)} endpoints")
+        return tip
+
+    def current_tip(self, max_age: Optional[float] = None, now: Optional[float] = None) -> Optional[float]:
+        """Return the consensus tip projected to ``now``, or None if it is older than ``max_age``."""
+        with self._lock:
+            tip = self._tip
+        if tip is None:
+            return None
+
+        slot, timestamp = tip
+        age = max(0.0, (time.time() if now is None else now) - timestamp)
+        if age > (3 * self.interval if max_age is None else max_age):
+            return None
+        return slot + age / SLOT_DURATION
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self.poll()
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.error(f"Reference tip poll failed: {e}")
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def start(self) -> None:
+        """Poll the reference endpoints in a background thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="reference-tip-tracker", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background polling thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
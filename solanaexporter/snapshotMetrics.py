@@ -0,0 +1,163 @@
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence, Set, Tuple
+
+from prometheus_client import CollectorRegistry
+from prometheus_client.core import (
+    CounterMetricFamily,
+    GaugeMetricFamily,
+    InfoMetricFamily,
+    Metric,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+class SnapshotMetric:
+    """Handle for one metric family whose values live in a :class:`SnapshotCollector`."""
+
+    def __init__(
+        self,
+        collector: "SnapshotCollector",
+        kind: str,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ):
+        self._collector = collector
+        self.kind = kind
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def set(self, value: float, labels: Sequence[str] = ()) -> None:
+        """Stage a sample value for the next snapshot."""
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        if self.labelnames:
+            self._collector.stage_sample(self.name, tuple(labels), float(value))
+        else:
+            self._collector.stage(self.name, float(value))
+
+    def inc(self, amount: float = 1, labels: Sequence[str] = ()) -> None:
+        """Increment a staged counter sample."""
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts")
+        self.set((self.get(labels) or 0.0) + amount, labels)
+
+    def info(self, value: Dict[str, str]) -> None:
+        """Stage the label set of an info metric for the next snapshot."""
+        self._collector.stage(self.name, dict(value))
+
+    def remove(self, labels: Sequence[str]) -> None:
+        """Drop one labeled sample from the next snapshot."""
+        self._collector.remove_sample(self.name, tuple(labels))
+
+    def clear(self) -> None:
+        """Drop every sample of this family from the next snapshot."""
+        self._collector.stage(self.name, {} if self.labelnames else None)
+
+    def get(self, labels: Sequence[str] = ()) -> Any:
+        """Return the value staged for the next snapshot."""
+        value = self._collector.staged(self.name)
+        if self.labelnames:
+            return (value or {}).get(tuple(labels))
+        if value is None and self.kind != "info":
+            return 0.0
+        return value
+
+    def family(self, value: Any) -> Metric:
+        """Build the metric family exposed for ``value`` taken from a snapshot."""
+        if self.kind == "info":
+            return InfoMetricFamily(self.name, self.documentation, value=value or {})
+
+        family_type = CounterMetricFamily if self.kind == "counter" else GaugeMetricFamily
+        family = family_type(self.name, self.documentation, labels=self.labelnames)
+        if self.labelnames:
+            for labels, sample in (value or {}).items():
+                family.add_metric(labels, sample)
+        else:
+            family.add_metric([], 0.0 if value is None else value)
+        return family
+
+
+class SnapshotCollector:
+    """Expose metrics from immutable snapshots that are swapped in atomically.
+
+    Updates are staged in a working copy by a single writer and become visible to scrapes
+    only when :meth:`publish` replaces the current snapshot, so every scrape sees the values
+    of one complete poll. Labeled families are stored as plain dicts and copied on their
+    first write after a publish, so unchanged families are shared between snapshots.
+    """
+
+    def __init__(self, registry: Optional[CollectorRegistry] = None):
+        self._metrics: Dict[str, SnapshotMetric] = {}
+        self._snapshot: Mapping[str, Any] = MappingProxyType({})
+        self._working: Dict[str, Any] = {}
+        self._copied: Set[str] = set()
+        if registry is not None:
+            registry.register(self)
+
+    def _add(self, kind: str, name: str, documentation: str, labelnames: Sequence[str]) -> SnapshotMetric:
+        if name in self._metrics:
+            raise ValueError(f"Duplicated metric name: {name}")
+        metric = SnapshotMetric(self, kind, name, documentation, labelnames)
+        self._metrics[name] = metric
+        return metric
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> SnapshotMetric:
+        """Define a gauge family."""
+        return self._add("gauge", name, documentation, labelnames)
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> SnapshotMetric:
+        """Define a counter family."""
+        return self._add("counter", name, documentation, labelnames)
+
+    def info(self, name: str, documentation: str) -> SnapshotMetric:
+        """Define an info metric."""
+        return self._add("info", name, documentation, ())
+
+    def stage(self, name: str, value: Any) -> None:
+        """Replace the staged value of a whole family."""
+        self._working[name] = value
+        self._copied.add(name)
+
+    def stage_sample(self, name: str, labels: LabelValues, value: float) -> None:
+        """Set one labeled sample, copying the family away from the published snapshot first."""
+        if name not in self._copied:
+            self._working[name] = dict(self._working.get(name) or {})
+            self._copied.add(name)
+        self._working[name][labels] = value
+
+    def remove_sample(self, name: str, labels: LabelValues) -> None:
+        """Remove one labeled sample, copying the family away from the published snapshot first."""
+        if labels not in (self._working.get(name) or {}):
+            return
+        if name not in self._copied:
+            self._working[name] = dict(self._working[name])
+            self._copied.add(name)
+        del self._working[name][labels]
+
+    def staged(self, name: str) -> Any:
+        """Return the staged value of a family."""
+        return self._working.get(name)
+
+    @property
+    def snapshot(self) -> Mapping[str, Any]:
+        """The snapshot currently exposed to scrapes."""
+        return self._snapshot
+
+    def publish(self) -> None:
+        """Atomically expose the staged values and start a new working copy from them."""
+        self._snapshot = MappingProxyType(self._working)
+        self._working = dict(self._working)
+        self._copied = set()
+
+    def discard(self) -> None:
+        """Drop the staged values and start a new working copy from the published snapshot."""
+        self._working = dict(self._snapshot)
+        self._copied = set()
+
+    def collect(self) -> Iterator[Metric]:
+        snapshot = self._snapshot
+        for metric in self._metrics.values():
+            yield metric.family(snapshot.get(metric.name))
@@ -1,11 +1,27 @@
 import os
 import time
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from exporter.jsonRPCRequest import JsonRPCRequest
 from exporter.jsonRPCResponse import JsonRPCResponse
 from exporter.rpcExporter import RPCExporter
-from prometheus_client import Gauge, Info
+from prometheus_client import generate_latest
+
+from solanaexporter.clusterCache import (
+    CLUSTER_CACHE_KEYS,
+    DEFAULT_CLUSTER_CACHE_MAX_AGE,
+    read_cluster_cache,
+)
+from solanaexporter.clusterNodes import ClusterNodesTracker
+from solanaexporter.metricsPusher import DEFAULT_PUSH_JOB, MetricsPusher
+from solanaexporter.pollProfiler import PollProfiler, ProfilingServer
+from solanaexporter.referenceTip import (
+    DEFAULT_REFERENCE_POLL_INTERVAL,
+    DEFAULT_REFERENCE_TIMEOUT,
+    ReferenceTipTracker,
+)
+from solanaexporter.snapshotMetrics import SnapshotCollector
+from solanaexporter.voteTransactions import VoteTransactionCounter
 
 # Solana-specific configuration keys
 # Required configuration keys - these must be present
@@ -23,6 +39,17 @@ REQUIRED_CONFIG_KEYS = {
 # Optional configuration keys - these can be omitted
 OPTIONAL_CONFIG_KEYS = {
     "double_zero_fees_address": "DOUBLE_ZERO_FEES_ADDRESS",
+    "cluster_cache_path": "CLUSTER_CACHE_PATH",
+    "cluster_cache_max_age": "CLUSTER_CACHE_MAX_AGE",
+    "reference_rpc_urls": "REFERENCE_RPC_URLS",
+    "reference_poll_interval": "REFERENCE_POLL_INTERVAL",
+    "reference_timeout": "REFERENCE_TIMEOUT",
+    "vote_tx_cursor_path": "VOTE_TX_CURSOR_PATH",
+    "vote_tx_rpc_url": "VOTE_TX_RPC_URL",
+    "cluster_nodes_interval": "CLUSTER_NODES_INTERVAL",
+    "push_gateway_url": "PUSH_GATEWAY_URL",
+    "push_job": "PUSH_JOB",
+    "profiling_port": "PROFILING_PORT",
 }
 
 # All configuration keys combined
@@ -38,116 +65,240 @@ class SolanaExporter(RPCExporter):
             required_keys=REQUIRED_CONFIG_KEYS,
         )
 
-        # Prometheus metrics setup
-        self.slot_number = Gauge(
-            "solana_slot_number",
-            "Current slot number of the Solana validator",
-            registry=self.registry,
+        # Prometheus metrics setup, exposed from one snapshot per poll
+        self.metrics = SnapshotCollector(registry=self.registry)
+        self.slot_number = self.metrics.gauge("solana_slot_number", "Current slot number of the Solana validator")
+        self.absolute_slot_number = self.metrics.gauge(
+            "solana_absolute_slot_number", "Absolute slot number of the Solana chain"
         )
-        self.absolute_slot_number = Gauge(
-            "solana_absolute_slot_number",
-            "Absolute slot number of the Solana chain",
-            registry=self.registry,
+        self.slot_lag = self.metrics.gauge("solana_slot_lag", "Slot number lag of validator vs the Solana chain")
+        self.sync_status = self.metrics.gauge("solana_sync_status", "Node sync status (1 for synced, 0 for not synced)")
+        self.slot_time = self.metrics.gauge("solana_slot_time", "Time taken to process a slot")
+        self.epoch = self.metrics.gauge("solana_epoch", "Current Solana epoch")
+        self.balance = self.metrics.gauge("solana_account_balance", "Validator's account balance")
+        self.double_zero_balance = self.metrics.gauge(
+            "solana_double_zero_balance", "Balance of the double zero fees address"
         )
-        self.slot_lag = Gauge(
-            "solana_slot_lag",
-            "Slot number lag of validator vs the Solana chain",
-            registry=self.registry,
+        self.health_status = self.metrics.gauge("solana_health_status", "Health status of the Solana node")
+        self.total_delegated_stake = self.metrics.gauge(
+            "solana_total_delegated_stake", "Total stake delegated to the validator"
         )
-        self.sync_status = Gauge(
-            "solana_sync_status",
-            "Node sync status (1 for synced, 0 for not synced)",
-            registry=self.registry,
+        self.delinquent_stake = self.metrics.gauge("solana_delinquent_stake", "Stake that is delinquent")
+        self.pending_stake = self.metrics.gauge("solana_pending_stake", "Stake that is delegated but not active yet")
+        self.missed_slots = self.metrics.gauge("solana_missed_slots", "Number of slots missed by the validator")
+        self.leader_status = self.metrics.gauge("solana_leader_status", "Leader status (1 or 0)")
+        self.vote_distance = self.metrics.gauge("solana_vote_distance", "Vote distance from the highest known slot")
+        self.block_production_success = self.metrics.gauge(
+            "solana_block_production_success", "Block production status (1 for success, 0 for failure)"
         )
-        self.slot_time = Gauge(
-            "solana_slot_time",
-            "Time taken to process a slot",
-            registry=self.registry,
+        self.credits_earned = self.metrics.gauge("solana_credits_earned", "Total vote credits earned by the validator")
+        self.vote_transactions = self.metrics.counter(
+            "solana_vote_transactions",
+            "Transactions of the vote and identity accounts since start",
+            labelnames=["account", "status"],
         )
-        self.epoch = Gauge(
-            "solana_epoch",
-            "Current Solana epoch",
-            registry=self.registry,
-        )
-        self.balance = Gauge("solana_account_balance", "Validator's account balance", registry=self.registry)
-        self.double_zero_balance = Gauge(
-            "solana_double_zero_balance",
-            "Balance of the double zero fees address",
-            registry=self.registry,
-        )
-        self.health_status = Gauge("solana_health_status", "Health status of the Solana node", registry=self.registry)
-        self.total_delegated_stake = Gauge(
-            "solana_total_delegated_stake",
-            "Total stake delegated to the validator",
-            registry=self.registry,
-        )
-        self.delinquent_stake = Gauge("solana_delinquent_stake", "Stake that is delinquent", registry=self.registry)
-        self.pending_stake = Gauge(
-            "solana_pending_stake",
-            "Stake that is delegated but not active yet",
-            registry=self.registry,
-        )
-        self.missed_slots = Gauge(
-            "solana_missed_slots",
-            "Number of slots missed by the validator",
-            registry=self.registry,
-        )
-        self.leader_status = Gauge("solana_leader_status", "Leader status (1 or 0)", registry=self.registry)
-        self.vote_distance = Gauge(
-            "solana_vote_distance",
-            "Vote distance from the highest known slot",
-            registry=self.registry,
-        )
-        self.block_production_success = Gauge(
-            "solana_block_production_success",
-            "Block production status (1 for success, 0 for failure)",
-            registry=self.registry,
-        )
-        self.credits_earned = Gauge(
-            "solana_credits_earned",
-            "Total vote credits earned by the validator",
-            registry=self.registry,
-        )
-        self.build_info = Info(
-            "solana_build",
-            "Build information including version and instance label",
-            registry=self.registry,
+        self.vote_transaction_rate = self.metrics.gauge(
+            "solana_vote_transaction_rate",
+            "Transactions per second of the vote and identity accounts over the last poll",
+            labelnames=["account", "status"],
         )
+        self.build_info = self.metrics.info("solana_build", "Build information including version and instance label")
 
         self.programAccountsCallCounter: int = -1
         self.stake_accounts: List[JsonRPCResponse] = []
         self.last_absolute_slot = None
         self.last_timestamp = None
 
+        self.vote_transaction_counter: Optional[VoteTransactionCounter] = None
+        self.last_vote_transaction_poll: Optional[float] = None
+        self.vote_transaction_totals: Dict[Tuple[str, str], int] = {}
+        vote_tx_cursor_path = getattr(self.config, "vote_tx_cursor_path", None)
+        if vote_tx_cursor_path:
+            # getSignaturesForAddress needs transaction history, which validator RPC nodes usually disable
+            self.vote_transaction_counter = VoteTransactionCounter(
+                rpc_url=getattr(self.config, "vote_tx_rpc_url", None) or self.public_rpc_url,
+                addresses=[self.config.vote_pubkey, self.config.validator_pubkey],
+                cursor_path=vote_tx_cursor_path,
+                logger=self.logger,
+            )
+
+        self.cluster_nodes_tracker: Optional[ClusterNodesTracker] = None
+        self.last_cluster_nodes_refresh: Optional[float] = None
+        # Set when staged topology diffs were discarded, so the next refresh restages everything
+        self.cluster_nodes_restage = True
+        cluster_nodes_interval = getattr(self.config, "cluster_nodes_interval", None)
+        if cluster_nodes_interval:
+            self.cluster_nodes_interval = float(cluster_nodes_interval)
+            self.cluster_nodes_tracker = ClusterNodesTracker(identity=self.config.validator_pubkey)
+            # Gossip metrics are only exposed when topology tracking is enabled, never as a default 0
+            self.cluster_nodes = self.metrics.gauge("solana_cluster_nodes", "Number of nodes visible in gossip")
+            self.cluster_nodes_churn = self.metrics.gauge(
+                "solana_cluster_nodes_churn", "Number of gossip nodes added, removed or changed since the last refresh"
+            )
+            self.gossip_present = self.metrics.gauge(
+                "solana_gossip_present", "Validator identity visible in gossip (1 or 0)"
+            )
+            self.gossip_node_info = self.metrics.gauge(
+                "solana_gossip_node_info",
+                "Version and addresses the validator advertises in gossip",
+                labelnames=["version", "gossip", "tpu", "rpc"],
+            )
+            self.cluster_version_nodes = self.metrics.gauge(
+                "solana_cluster_version_nodes", "Number of gossip nodes per advertised version", labelnames=["version"]
+            )
+            self.cluster_version_stake = self.metrics.gauge(
+                "solana_cluster_version_stake",
+                "Activated stake of gossip nodes per advertised version",
+                labelnames=["version"],
+            )
+            self.version_stake_share = self.metrics.gauge(
+                "solana_version_stake_share", "Share of the cluster stake running the validator's advertised version"
+            )
+
+        self.metrics_pusher: Optional[MetricsPusher] = None
+        push_gateway_url = getattr(self.config, "push_gateway_url", None)
+        if push_gateway_url:
+            self.metrics_pusher = MetricsPusher(
+                url=push_gateway_url,
+                job=getattr(self.config, "push_job", None) or DEFAULT_PUSH_JOB,
+                instance=str(self.config.label),
+                logger=self.logger,
+            )
+            self.push_buffer_depth = self.metrics.gauge(
+                "solana_push_buffer_depth", "Number of metric snapshots waiting to be pushed"
+            )
+            self.push_latency = self.metrics.gauge(
+                "solana_push_latency_seconds", "Duration of the last successful push to the Pushgateway"
+            )
+            self.push_failures = self.metrics.counter(
+                "solana_push_failures", "Snapshots that could not be pushed after all retries"
+            )
+            self.push_dropped = self.metrics.counter(
+                "solana_push_dropped", "Snapshots dropped because a newer one was pushed instead"
+            )
+
+        # Debug profiling of collect_metrics, only created when a profiling port is configured
+        self.profiler: Optional[PollProfiler] = None
+        if getattr(self.config, "profiling_port", None):
+            self.profiler = PollProfiler(logger=self.logger)
+
+        self.reference_tip_tracker: Optional[ReferenceTipTracker] = None
+        reference_rpc_urls = getattr(self.config, "reference_rpc_urls", None)
+        if reference_rpc_urls:
+            poll_interval = getattr(self.config, "reference_poll_interval", None)
+            timeout = getattr(self.config, "reference_timeout", None)
+            self.reference_tip_tracker = ReferenceTipTracker(
+                endpoints=[url.strip() for url in reference_rpc_urls.split(",") if url.strip()],
+                logger=self.logger,
+                interval=float(poll_interval) if poll_interval else DEFAULT_REFERENCE_POLL_INTERVAL,
+                timeout=float(timeout) if timeout else DEFAULT_REFERENCE_TIMEOUT,
+            )
+            self.reference_tip = self.metrics.gauge(
+                "solana_reference_tip_slot", "Cluster tip slot agreed on by the reference endpoints"
+            )
+            self.reference_endpoints = self.metrics.gauge(
+                "solana_reference_endpoints", "Number of reference endpoints contributing to the cluster tip"
+            )
+
+    def start_exporter(self):
+        """Start the background helpers alongside the exporter loop."""
+        self._start_background_tasks()
+        super().start_exporter()
+
+    def _start_background_tasks(self) -> None:
+        """Start the reference tip tracker and the profiling endpoint, if configured."""
+        if self.reference_tip_tracker is not None:
+            self.reference_tip_tracker.start()
+        if self.profiler is not None:
+            port = int(self.config.profiling_port)
+            # Allow twice the poll interval per profiled poll plus some slack for slow RPC
+            server = ProfilingServer(
+                ("127.0.0.1", port), self.profiler, poll_timeout=2 * float(self.config.poll_interval) + 30
+            )
+            server.start()
+            self.logger.info(f"Profiling endpoint listening on http://127.0.0.1:{port}/debug/profile")
+
+    def start_push_exporter(self):
+        """Run the collection loop and push each poll's snapshot instead of serving scrapes."""
+        if self.metrics_pusher is None:
+            raise ValueError("PUSH_GATEWAY_URL must be configured for push mode")
+        self._start_background_tasks()
+        self.metrics_pusher.start()
+
+        poll_interval = float(self.config.poll_interval)
+        while True:
+            started = time.monotonic()
+            try:
+                self.collect_metrics()
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.error(f"Metric collection failed: {e}")
+            self.metrics_pusher.enqueue(generate_latest(self.registry))
+            time.sleep(max(0.0, poll_interval - (time.monotonic() - started)))
+
     def collect_metrics(self):
+        """Collect metrics and publish them to scrapes as one consistent snapshot."""
+        profiler = self.profiler
+        if profiler is not None and profiler.active:
+            profiler.begin_poll()
+        try:
+            self._collect_metrics()
+        except Exception:
+            # A failed poll must not expose its partial updates mixed with the previous snapshot
+            self.metrics.discard()
+            self.cluster_nodes_restage = True
+            raise
+        else:
+            self._profile_phase("publish")
+            self._update_push_metrics()
+            self.metrics.publish()
+        finally:
+            if profiler is not None:
+                profiler.end_poll()
+
+    def _profile_phase(self, phase: str) -> None:
+        """Attribute the rest of a profiled poll to ``phase``."""
+        if self.profiler is not None:
+            self.profiler.mark(phase)
+
+    def _collect_metrics(self):
         """Collect metrics using a batched RPC call."""
+        self._profile_phase("stake_accounts")
         self.programAccountsCallCounter += 1
         if self.programAccountsCallCounter % 5 != 0:
             self.stake_accounts = self._get_stake_accounts()
             self.programAccountsCallCounter = 0
 
-        rpc_requests: List[JsonRPCRequest] = [
-            JsonRPCRequest("getSlot"),
-            JsonRPCRequest("getBalance", params=[self.config.validator_pubkey]),
+        self._profile_phase("cluster_cache")
+        cluster_data = self._read_cluster_cache()
+
+        rpc_requests: List[Tuple[str, JsonRPCRequest]] = [
+            ("slot", JsonRPCRequest("getSlot")),
+            ("balance", JsonRPCRequest("getBalance", params=[self.config.validator_pubkey])),
         ]
 
-        # Track if we're requesting double_zero_balance
-        has_double_zero = False
         if hasattr(self.config, "double_zero_fees_address") and self.config.double_zero_fees_address:
-            rpc_requests.append(JsonRPCRequest("getBalance", params=[self.config.double_zero_fees_address]))
-            has_double_zero = True
-
-        rpc_requests.extend(
-            [
-                JsonRPCRequest("getVoteAccounts", params=[{"votePubkey": self.config.vote_pubkey}]),
-                JsonRPCRequest("getEpochInfo"),
-                JsonRPCRequest("getLeaderSchedule"),
-                JsonRPCRequest("getBlockProduction"),
-                JsonRPCRequest("getHealth"),
-            ]
-        )
+            rpc_requests.append(
+                ("double_zero_balance", JsonRPCRequest("getBalance", params=[self.config.double_zero_fees_address]))
+            )
 
-        responses: List[JsonRPCResponse] = self._batched_rpc_call(rpc_requests)
+        # Large cluster-level responses are only requested when no fresh shared snapshot is available
+        if cluster_data is None:
+            rpc_requests.append(
+                ("vote_accounts", JsonRPCRequest("getVoteAccounts", params=[{"votePubkey": self.config.vote_pubkey}]))
+            )
+        rpc_requests.append(("epoch_info", JsonRPCRequest("getEpochInfo")))
+        if cluster_data is None:
+            rpc_requests.extend(
+                [
+                    ("leader_schedule", JsonRPCRequest("getLeaderSchedule")),
+                    ("block_production", JsonRPCRequest("getBlockProduction")),
+                ]
+            )
+        rpc_requests.append(("health", JsonRPCRequest("getHealth")))
+
+        self._profile_phase("rpc")
+        responses: List[JsonRPCResponse] = self._batched_rpc_call([request for _, request in rpc_requests])
+        self._profile_phase("update")
         if not responses or len(responses) != len(rpc_requests):
             self.logger.error(
                 "RPC call failed or incomplete batch, setting health_status to 0 and other metrics to NaN"
@@ -156,68 +307,109 @@ class SolanaExporter(RPCExporter):
             self.sync_status.set(0)
             return
 
-        vote_accounts_result = None
-        epoch_info_result = None
-        slot_value = None
-        absolute_slot_value = None
-
-        # Calculate dynamic indices based on whether double_zero_balance is included
-        idx_offset = 1 if has_double_zero else 0
-        health_idx = 7 if has_double_zero else 6
-
-        for idx, response in enumerate(iterable=responses):
+        results: Dict[str, Any] = dict(cluster_data) if cluster_data is not None else {}
+        for (key, request), response in zip(rpc_requests, responses):
             if response.error:
-                self.logger.error(f"Error in RPC response for method {rpc_requests[idx].method}: {response.error}")
-                if idx == health_idx:
+                self.logger.error(f"Error in RPC response for method {request.method}: {response.error}")
+                if key == "health":
                     self.health_status.set(0)
                     self.sync_status.set(0)
                 continue
-            result = response.result
-
-            if idx == 0:  # getSlot
-                slot_value = result
-                self._update_slot_metrics(current_slot=result)
-            elif idx == 1:  # getBalance
-                balance = result.get("value", 0) / 1_000_000_000
-                self.balance.set(balance)
-                self.logger.debug(f"Updated balance: {balance}")
-            elif has_double_zero and idx == 2:  # getBalance (double_zero_fees_address)
-                double_zero_balance = result.get("value", 0) / 1_000_000_000
-                self.double_zero_balance.set(double_zero_balance)
-                self.logger.debug(f"Updated double_zero_balance: {double_zero_balance}")
-            elif idx == 2 + idx_offset:  # getVoteAccounts
-                self._update_stake_metrics(vote_accounts=result)
-                self._update_credits_earned(result)
-                vote_accounts_result = result
-            elif idx == 3 + idx_offset:  # getEpochInfo
-                absolute_slot_value = result.get("absoluteSlot", 0)
-                self._update_epoch_metrics(epoch_info=result)
-                epoch_info_result = result
-            elif idx == 4 + idx_offset:  # getLeaderSchedule
-                is_leader: bool = self.config.vote_pubkey in result
-                self.leader_status.set(1 if is_leader else 0)
-                self.logger.debug(f"Updated leader status: {1 if is_leader else 0}")
-            elif idx == 5 + idx_offset:  # getBlockProduction
-                self._update_block_production_metrics(block_production_data=result)
-            elif idx == 6 + idx_offset:  # getHealth
-                health: Literal[1] | Literal[0] = 1 if result == "ok" else 0
-                self.health_status.set(value=health)
-                self.logger.debug(msg=f"Updated health status: {health}")
-
-        # Calculate slot_lag and sync_status using values from the same probe
-        if slot_value is not None and absolute_slot_value is not None:
+            results[key] = response.result
+
+        slot_value = results.get("slot")
+        if slot_value is not None:
+            self._update_slot_metrics(current_slot=slot_value)
+        if "balance" in results:
+            balance = results["balance"].get("value", 0) / 1_000_000_000
+            self.balance.set(balance)
+            self.logger.debug(f"Updated balance: {balance}")
+        if "double_zero_balance" in results:
+            double_zero_balance = results["double_zero_balance"].get("value", 0) / 1_000_000_000
+            self.double_zero_balance.set(double_zero_balance)
+            self.logger.debug(f"Updated double_zero_balance: {double_zero_balance}")
+
+        vote_accounts_result = results.get("vote_accounts")
+        if vote_accounts_result is not None:
+            self._update_stake_metrics(vote_accounts=vote_accounts_result)
+            self._update_credits_earned(vote_accounts_result)
+
+        epoch_info_result = results.get("epoch_info")
+        absolute_slot_value = None
+        if epoch_info_result is not None:
+            absolute_slot_value = epoch_info_result.get("absoluteSlot", 0)
+            self._update_epoch_metrics(epoch_info=epoch_info_result)
+
+        if "leader_schedule" in results:
+            is_leader: bool = self.config.vote_pubkey in results["leader_schedule"]
+            self.leader_status.set(1 if is_leader else 0)
+            self.logger.debug(f"Updated leader status: {1 if is_leader else 0}")
+        if "block_production" in results:
+            self._update_block_production_metrics(block_production_data=results["block_production"])
+        if "health" in results:
+            health: Literal[1] | Literal[0] = 1 if results["health"] == "ok" else 0
+            self.health_status.set(value=health)
+            self.logger.debug(msg=f"Updated health status: {health}")
+
+        # Calculate slot_lag and sync_status against the reference tip, or the same probe without one
+        reference_tip = self._current_reference_tip()
+        if slot_value is not None and reference_tip is not None:
+            self._update_slot_lag_and_sync_status(slot_value, reference_tip)
+        elif slot_value is not None and absolute_slot_value is not None:
             self._update_slot_lag_and_sync_status(slot_value, absolute_slot_value)
 
         self._update_vote_distance(vote_accounts_result, epoch_info_result)
+        self._profile_phase("vote_transactions")
+        self._update_vote_transactions()
+        self._profile_phase("cluster_nodes")
+        self._update_cluster_nodes()
+        self._profile_phase("update")
         # update metrics from config file
         self._update_build_info()
 
+    def _read_cluster_cache(self) -> Optional[Dict[str, Any]]:
+        """Return fresh cluster data from the shared cache, or None to fall back to direct RPC."""
+        cache_path = getattr(self.config, "cluster_cache_path", None)
+        if not cache_path:
+            return None
+
+        max_age = getattr(self.config, "cluster_cache_max_age", None)
+        cluster_data = read_cluster_cache(cache_path, float(max_age) if max_age else DEFAULT_CLUSTER_CACHE_MAX_AGE)
+        if cluster_data is None:
+            self.logger.warning(f"Cluster cache {cache_path} missing or stale, falling back to direct RPC")
+            return None
+
+        # The shared snapshot holds every vote account; keep only ours as the filtered RPC call would
+        vote_accounts = cluster_data["vote_accounts"]
+        cluster_data["vote_accounts"] = {
+            status: [
+                account
+                for account in vote_accounts.get(status, [])
+                if account.get("votePubkey") == self.config.vote_pubkey
+            ]
+            for status in ("current", "delinquent")
+        }
+        self.logger.debug(f"Using cluster data from cache {cache_path}")
+        return {key: cluster_data[key] for key in CLUSTER_CACHE_KEYS}
+
+    def _current_reference_tip(self) -> Optional[int]:
+        """Return the consensus cluster tip from the reference endpoints, if fresh."""
+        if self.reference_tip_tracker is None:
+            return None
+        tip = self.reference_tip_tracker.current_tip()
+        if tip is None:
+            self.logger.warning("Reference tip unavailable or stale, using slot from the same probe")
+            return None
+        self.reference_tip.set(round(tip))
+        self.reference_endpoints.set(self.reference_tip_tracker.endpoints_used)
+        return round(tip)
+
     def _update_slot_lag_and_sync_status(self, slot_value, absolute_slot_value):
-        """Update slot_lag and sync_status metrics using values from the same probe."""
+        """Update slot_lag and sync_status metrics against the given cluster slot."""
         slot_lag = abs(slot_value - absolute_slot_value)
         self.slot_lag.set(slot_lag)
         self.sync_status.set(1 if slot_lag <= 64 else 0)
-        self.logger.debug(f"Updated slot lag (same probe): {slot_lag}, sync status: {1 if slot_lag <= 64 else 0}")
+        self.logger.debug(f"Updated slot lag: {slot_lag}, sync status: {1 if slot_lag <= 64 else 0}")
 
     def _update_vote_distance(self, vote_accounts_result, epoch_info_result):
         """Update the vote distance metric."""
@@ -233,6 +425,92 @@ class SolanaExporter(RPCExporter):
         self.vote_distance.set(vote_distance)
         self.logger.debug(f"Updated vote distance: {vote_distance}")
 
+    def _update_vote_transactions(self) -> None:
+        """Count vote and identity transactions added since the last poll."""
+        if self.vote_transaction_counter is None:
+            return
+        counts = self.vote_transaction_counter.poll()
+        now = time.time()
+        if counts is None:
+            return
+
+        elapsed = now - self.last_vote_transaction_poll if self.last_vote_transaction_poll is not None else None
+        self.last_vote_transaction_poll = now
+        for account, (successes, failures) in counts.items():
+            for status, count in (("success", successes), ("failure", failures)):
+                # Totals are kept outside the snapshot so counts of a discarded poll are not lost
+                total = self.vote_transaction_totals.get((account, status), 0) + count
+                self.vote_transaction_totals[(account, status)] = total
+                self.vote_transactions.set(total, labels=[account, status])
+                if elapsed:
+                    self.vote_transaction_rate.set(count / elapsed, labels=[account, status])
+            self.logger.debug(f"Updated vote transactions for {account}: {successes} succeeded, {failures} failed")
+
+    def _update_cluster_nodes(self) -> None:
+        """Refresh gossip and cluster version metrics once the cluster nodes interval has passed."""
+        if self.cluster_nodes_tracker is None:
+            return
+        now = time.monotonic()
+        if self.last_cluster_nodes_refresh is not None:
+            if now - self.last_cluster_nodes_refresh < self.cluster_nodes_interval:
+                return
+
+        rpc_requests = [JsonRPCRequest("getClusterNodes"), JsonRPCRequest("getVoteAccounts")]
+        responses: List[JsonRPCResponse] = self._batched_rpc_call(rpc_requests)
+        if not responses or len(responses) != len(rpc_requests):
+            self.logger.error("Cluster nodes RPC call failed or incomplete batch, keeping previous topology")
+            return
+        for request, response in zip(rpc_requests, responses):
+            if response.error:
+                self.logger.error(f"Error in RPC response for method {request.method}: {response.error}")
+                return
+        self.last_cluster_nodes_refresh = now
+
+        tracker = self.cluster_nodes_tracker
+        stake_changes = tracker.update_stakes(responses[1].result)
+        churn = tracker.update_nodes(responses[0].result)
+        changed_versions, identity_changed = tracker.pop_changes()
+        if self.cluster_nodes_restage:
+            self.cluster_version_nodes.clear()
+            self.cluster_version_stake.clear()
+            changed_versions, identity_changed = set(tracker.version_nodes), True
+            self.cluster_nodes_restage = False
+
+        # Only versions and our own entry touched by this refresh are restaged
+        for version in changed_versions:
+            if version in tracker.version_nodes:
+                self.cluster_version_nodes.set(tracker.version_nodes[version], labels=[version])
+                self.cluster_version_stake.set(tracker.version_stake[version] / 1_000_000_000, labels=[version])
+            else:
+                self.cluster_version_nodes.remove(labels=[version])
+                self.cluster_version_stake.remove(labels=[version])
+
+        own_node = tracker.nodes.get(self.config.validator_pubkey)
+        if identity_changed:
+            self.gossip_node_info.clear()
+            if own_node is not None:
+                self.gossip_node_info.set(1, labels=[own_node.version, own_node.gossip, own_node.tpu, own_node.rpc])
+            self.gossip_present.set(1 if own_node is not None else 0)
+
+        stake_share = 0.0
+        if own_node is not None and tracker.total_stake:
+            stake_share = tracker.version_stake.get(own_node.version, 0) / tracker.total_stake
+        self.version_stake_share.set(stake_share)
+        self.cluster_nodes.set(len(tracker.nodes))
+        self.cluster_nodes_churn.set(churn)
+        self.logger.debug(
+            f"Updated cluster nodes: {len(tracker.nodes)} nodes, {churn} changed, {stake_changes} stake changes"
+        )
+
+    def _update_push_metrics(self) -> None:
+        """Update metrics describing the push mode backlog and latency."""
+        if self.metrics_pusher is None:
+            return
+        self.push_buffer_depth.set(self.metrics_pusher.buffer_depth)
+        self.push_latency.set(self.metrics_pusher.last_latency)
+        self.push_failures.set(self.metrics_pusher.failures)
+        self.push_dropped.set(self.metrics_pusher.dropped)
+
     def _update_slot_metrics(self, current_slot):
         """Update slot-related metrics."""
         self.slot_number.set(current_slot)
@@ -337,7 +615,9 @@ class SolanaExporter(RPCExporter):
             elapsed_time = current_timestamp - self.last_timestamp
             slots_processed = current_absolute_slot - self.last_absolute_slot
 
-            if elapsed_time > 0:
+            if slots_processed <= 0:
+                self.logger.warning("Absolute slot did not advance since the last poll, keeping slot time")
+            elif elapsed_time > 0:
                 slots_per_second = slots_processed / elapsed_time
                 self.slot_time.set(1 / slots_per_second)
                 self.logger.debug(f"Updated slot time: {1 / slots_per_second}, slots_per_second: {slots_per_second}")
@@ -389,4 +669,7 @@ if __name__ == "__main__":
     configFile: str | None = os.getenv("EXPORTER_ENV")
     print(f"starting solana exporter -- config {configFile}")
     exporter = SolanaExporter(config_source="fromFile", config_file=configFile)
-    exporter.start_exporter()
+    if exporter.metrics_pusher is not None:
+        exporter.start_push_exporter()
+    else:
+        exporter.start_exporter()
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from solanaexporter.solanaExporter import SolanaExporter
 
@@ -41,14 +41,43 @@ class TestSolanaExporter(unittest.TestCase):
         exporter = SolanaExporter(config_source="fromEnv")
         exporter.collect_metrics()
 
-        self.assertEqual(exporter.slot_number._value.get(), 12345)
-        self.assertEqual(exporter.balance._value.get(), 100)
-        self.assertEqual(exporter.double_zero_balance._value.get(), 50)
+        self.assertEqual(exporter.slot_number.get(), 12345)
+        self.assertEqual(exporter.balance.get(), 100)
+        self.assertEqual(exporter.double_zero_balance.get(), 50)
         # Check that build_info contains the expected version and label strings
-        build_info_labels = exporter.build_info._value
+        build_info_labels = exporter.build_info.get()
         self.assertEqual(build_info_labels.get("version"), "0.708.20306")
         self.assertEqual(build_info_labels.get("label"), "Blocksize_Testnet_Main")
 
+    @patch("os.environ", new_callable=lambda: {})
+    @patch("requests.post")
+    def test_failed_poll_keeps_previous_snapshot(self, mock_post, mock_env):
+        """A poll raising halfway leaves the previous snapshot exposed unchanged."""
+        mock_env.update(self.env)
+        mock_post.return_value.status_code = 200
+        responses = [
+            {"result": 12345},  # getSlot
+            {"result": {"value": 100_000_000_000}},  # getBalance
+            {"result": {"value": 50_000_000_000}},  # getBalance (double_zero_fees_address)
+            {"result": {"current": [], "delinquent": []}},  # getVoteAccounts
+            {"result": {"absoluteSlot": 12395, "epoch": 713}},  # getEpochInfo
+            {"result": {}},  # getLeaderSchedule
+            {"result": {"value": {"byIdentity": {}}}},  # getBlockProduction
+            {"result": "ok"},  # getHealth
+        ]
+        mock_post.return_value.json.return_value = responses
+        exporter = SolanaExporter(config_source="fromEnv")
+        exporter._get_stake_accounts = MagicMock(return_value=[])
+        exporter.collect_metrics()
+
+        responses[0] = {"result": 12400}
+        with patch.object(exporter, "_update_block_production_metrics", side_effect=RuntimeError("malformed")):
+            with self.assertRaises(RuntimeError):
+                exporter.collect_metrics()
+
+        self.assertEqual(exporter.metrics.snapshot["solana_slot_number"], 12345)
+        self.assertEqual(exporter.slot_number.get(), 12345)
+
     @patch("requests.post")
     @patch.dict(
         "os.environ",
@@ -108,9 +137,9 @@ class TestSolanaExporter(unittest.TestCase):
         exporter.stake_accounts = exporter._get_stake_accounts()
         exporter._update_stake_metrics(vote_accounts)
 
-        self.assertEqual(exporter.total_delegated_stake._value.get(), 500)
-        self.assertEqual(exporter.delinquent_stake._value.get(), 200)
-        self.assertAlmostEqual(exporter.pending_stake._value.get(), 1_666.666 - 500)
+        self.assertEqual(exporter.total_delegated_stake.get(), 500)
+        self.assertEqual(exporter.delinquent_stake.get(), 200)
+        self.assertAlmostEqual(exporter.pending_stake.get(), 1_666.666 - 500)
 
     @patch("os.environ", new_callable=lambda: {})
     @patch("requests.post")
@@ -136,8 +165,8 @@ class TestSolanaExporter(unittest.TestCase):
         exporter = SolanaExporter(config_source="fromEnv")
         exporter.collect_metrics()
 
-        self.assertEqual(exporter.slot_number._value.get(), 12345)
-        self.assertEqual(exporter.balance._value.get(), 100)
+        self.assertEqual(exporter.slot_number.get(), 12345)
+        self.assertEqual(exporter.balance.get(), 100)
         # double_zero_balance should not be set (or remain at initial value)
 
     @patch("os.environ", new_callable=lambda: {})
@@ -172,8 +201,8 @@ class TestSolanaExporter(unittest.TestCase):
         exporter.collect_metrics()
 
         # Verify the balance is correctly set to 4.89 SOL (not 0)
-        self.assertEqual(exporter.double_zero_balance._value.get(), 4.89)
-        self.assertGreater(exporter.double_zero_balance._value.get(), 0)
+        self.assertEqual(exporter.double_zero_balance.get(), 4.89)
+        self.assertGreater(exporter.double_zero_balance.get(), 0)
         # Verify the address was correctly read from config
         self.assertEqual(exporter.config.double_zero_fees_address, "4wm9PFxxRox3vgntwVdwbqvkRDjyjaqEdSiohosEJSj5")
 
@@ -0,0 +1,155 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from solanaexporter.clusterCache import (
+    read_cluster_cache,
+    write_cluster_cache,
+    write_json_atomic,
+)
+from solanaexporter.solanaExporter import SolanaExporter
+
+VOTE_PUBKEY = "6jJK69aeuLbVnM6nUKnmMMwyQG2rNjKNFrfM459kfAdL"
+VALIDATOR_PUBKEY = "4EKxPYXmBha7ADnZphFFC13RaKNYLZCiQPKuSV8YWRZc"
+
+
+def cluster_snapshot(timestamp):
+    return {
+        "timestamp": timestamp,
+        "vote_accounts": {
+            "current": [
+                {"votePubkey": VOTE_PUBKEY, "activatedStake": 500_000_000_000, "lastVote": 12390},
+                {"votePubkey": "OtherVote111111111111111111111111111111111", "activatedStake": 900_000_000_000},
+            ],
+            "delinquent": [{"votePubkey": "OtherDelinquent1111111111111111111111111111", "activatedStake": 1}],
+        },
+        "leader_schedule": {VOTE_PUBKEY: [1, 2, 3]},
+        "block_production": {"value": {"byIdentity": {VALIDATOR_PUBKEY: [4, 3]}}},
+    }
+
+
+class TestClusterCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp_dir.name, "cluster-cache.json")
+        self.env = {
+            "SOLANA_RPC_URL": "http://localhost:8899",
+            "SOLANA_PUBLIC_RPC_URL": "https://api.testnet.solana.com",
+            "EXPORTER_PORT": "7896",
+            "POLL_INTERVAL": "10",
+            "VOTE_PUBKEY": VOTE_PUBKEY,
+            "VALIDATOR_PUBKEY": VALIDATOR_PUBKEY,
+            "LABEL": "Blocksize_Testnet_Main",
+            "VERSION": "0.708.20306",
+            "CLUSTER_CACHE_PATH": self.cache_path,
+            "CLUSTER_CACHE_MAX_AGE": "30",
+        }
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_read_returns_published_snapshot(self):
+        """A published snapshot is read back unchanged while fresh."""
+        snapshot = cluster_snapshot(time.time())
+        write_cluster_cache(self.cache_path, snapshot)
+
+        self.assertEqual(read_cluster_cache(self.cache_path, max_age=30), snapshot)
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["cluster-cache.json"])
+
+    def test_failed_write_leaves_no_temporary_file(self):
+        """A snapshot that cannot be serialized leaves the previous one and no temporary file behind."""
+        snapshot = cluster_snapshot(time.time())
+        write_cluster_cache(self.cache_path, snapshot)
+
+        with self.assertRaises(TypeError):
+            write_json_atomic(self.cache_path, {"timestamp": object()})
+
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["cluster-cache.json"])
+        self.assertEqual(read_cluster_cache(self.cache_path, max_age=30), snapshot)
+
+    def test_read_missing_or_stale_cache(self):
+        """Missing, stale and incomplete snapshots are ignored."""
+        self.assertIsNone(read_cluster_cache(self.cache_path, max_age=30))
+
+        write_cluster_cache(self.cache_path, cluster_snapshot(time.time() - 60))
+        self.assertIsNone(read_cluster_cache(self.cache_path, max_age=30))
+
+        write_cluster_cache(self.cache_path, {"timestamp": time.time(), "leader_schedule": {}})
+        self.assertIsNone(read_cluster_cache(self.cache_path, max_age=30))
+
+    @patch("os.environ", new_callable=lambda: {})
+    @patch("requests.post")
+    def test_collect_metrics_uses_fresh_cache(self, mock_post, mock_env):
+        """Cluster data comes from the cache and only node-local methods are requested."""
+        mock_env.update(self.env)
+        write_cluster_cache(self.cache_path, cluster_snapshot(time.time()))
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = [
+            {"result": 12345},  # getSlot
+            {"result": {"value": 100_000_000_000}},  # getBalance
+            {"result": {"absoluteSlot": 12395, "epoch": 713}},  # getEpochInfo
+            {"result": "ok"},  # getHealth
+        ]
+
+        exporter = SolanaExporter(config_source="fromEnv")
+        exporter.collect_metrics()
+
+        self.assertEqual(exporter.slot_number.get(), 12345)
+        self.assertEqual(exporter.epoch.get(), 713)
+        self.assertEqual(exporter.total_delegated_stake.get(), 500)
+        self.assertEqual(exporter.delinquent_stake.get(), 0)
+        self.assertEqual(exporter.missed_slots.get(), 1)
+        self.assertEqual(exporter.vote_distance.get(), 5)
+        self.assertEqual(exporter.health_status.get(), 1)
+
+    @patch("os.environ", new_callable=lambda: {})
+    @patch("requests.post")
+    def test_polls_faster_than_cache_publishes(self, mock_post, mock_env):
+        """Polling twice against one snapshot keeps the slot time instead of dividing by zero."""
+        mock_env.update(self.env)
+        write_cluster_cache(self.cache_path, cluster_snapshot(time.time()))
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = [
+            {"result": 12345},  # getSlot
+            {"result": {"value": 100_000_000_000}},  # getBalance
+            {"result": {"absoluteSlot": 12345, "epoch": 713}},  # getEpochInfo
+            {"result": "ok"},  # getHealth
+        ]
+
+        exporter = SolanaExporter(config_source="fromEnv")
+        exporter._get_stake_accounts = MagicMock(return_value=[])
+        exporter.collect_metrics()
+        exporter.collect_metrics()
+
+        self.assertEqual(exporter.slot_time.get(), 0)
+        self.assertEqual(exporter.sync_status.get(), 1)
+        self.assertEqual(exporter.total_delegated_stake.get(), 500)
+
+    @patch("os.environ", new_callable=lambda: {})
+    @patch("requests.post")
+    def test_collect_metrics_falls_back_on_stale_cache(self, mock_post, mock_env):
+        """A stale cache falls back to requesting cluster data directly."""
+        mock_env.update(self.env)
+        write_cluster_cache(self.cache_path, cluster_snapshot(time.time() - 60))
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = [
+            {"result": 12345},  # getSlot
+            {"result": {"value": 100_000_000_000}},  # getBalance
+            {"result": {"current": [], "delinquent": []}},  # getVoteAccounts
+            {"result": {"absoluteSlot": 12400, "epoch": 714}},  # getEpochInfo
+            {"result": {}},  # getLeaderSchedule
+            {"result": {"value": {"byIdentity": {}}}},  # getBlockProduction
+            {"result": "ok"},  # getHealth
+        ]
+
+        exporter = SolanaExporter(config_source="fromEnv")
+        exporter.collect_metrics()
+
+        self.assertEqual(exporter.epoch.get(), 714)
+        self.assertEqual(exporter.absolute_slot_number.get(), 12400)
+
+
+if __name__ == "__main__":
+    unittest.main()
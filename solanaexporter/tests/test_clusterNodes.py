@@ -0,0 +1,110 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from prometheus_client import generate_latest
+
+from solanaexporter.clusterNodes import ClusterNodesTracker
+from solanaexporter.solanaExporter import SolanaExporter
+
+IDENTITY = "4EKxPYXmBha7ADnZphFFC13RaKNYLZCiQPKuSV8YWRZc"
+
+
+def node(pubkey, version, gossip="10.0.0.1:8001"):
+    return {"pubkey": pubkey, "version": version, "gossip": gossip, "tpu": "10.0.0.1:8003", "rpc": None}
+
+
+def vote_accounts(stakes):
+    return {
+        "current": [{"nodePubkey": pubkey, "activatedStake": stake} for pubkey, stake in stakes.items()],
+        "delinquent": [],
+    }
+
+
+def rpc_response(result):
+    response = MagicMock()
+    response.result = result
+    response.error = None
+    return response
+
+
+class TestClusterNodesTracker(unittest.TestCase):
+    def test_refresh_applies_only_changes(self):
+        """Version aggregates follow added, removed and upgraded nodes."""
+        tracker = ClusterNodesTracker(identity=IDENTITY)
+        tracker.update_stakes(vote_accounts({IDENTITY: 300, "B": 100, "C": 600}))
+
+        churn = tracker.update_nodes([node(IDENTITY, "2.0.1"), node("B", "2.0.1"), node("C", "1.18.0")])
+        self.assertEqual(churn, 3)
+        self.assertEqual(tracker.version_nodes, {"2.0.1": 2, "1.18.0": 1})
+        self.assertEqual(tracker.version_stake, {"2.0.1": 400, "1.18.0": 600})
+        self.assertEqual(tracker.pop_changes(), ({"2.0.1", "1.18.0"}, True))
+
+        churn = tracker.update_nodes([node(IDENTITY, "2.0.1"), node("C", "2.0.1"), node("D", "2.1.0")])
+        self.assertEqual(churn, 3)
+        self.assertEqual(tracker.version_nodes, {"2.0.1": 2, "2.1.0": 1})
+        self.assertEqual(tracker.version_stake, {"2.0.1": 900, "2.1.0": 0})
+        self.assertEqual(tracker.pop_changes(), ({"2.0.1", "1.18.0", "2.1.0"}, False))
+
+        self.assertEqual(tracker.update_nodes([node(IDENTITY, "2.0.1"), node("C", "2.0.1"), node("D", "2.1.0")]), 0)
+        self.assertEqual(tracker.pop_changes(), (set(), False))
+
+    def test_stake_changes_move_version_stake(self):
+        tracker = ClusterNodesTracker(identity=IDENTITY)
+        tracker.update_nodes([node(IDENTITY, "2.0.1"), node("B", "1.18.0")])
+        tracker.pop_changes()
+
+        self.assertEqual(tracker.update_stakes(vote_accounts({IDENTITY: 300, "B": 100})), 2)
+        self.assertEqual(tracker.update_stakes(vote_accounts({IDENTITY: 300, "B": 200})), 1)
+
+        self.assertEqual(tracker.total_stake, 500)
+        self.assertEqual(tracker.version_stake, {"2.0.1": 300, "1.18.0": 200})
+        self.assertEqual(tracker.pop_changes(), ({"2.0.1", "1.18.0"}, False))
+
+
+ENV = {
+    "SOLANA_RPC_URL": "http://localhost:8899",
+    "SOLANA_PUBLIC_RPC_URL": "https://api.testnet.solana.com",
+    "EXPORTER_PORT": "7896",
+    "POLL_INTERVAL": "10",
+    "VOTE_PUBKEY": "6jJK69aeuLbVnM6nUKnmMMwyQG2rNjKNFrfM459kfAdL",
+    "VALIDATOR_PUBKEY": IDENTITY,
+    "LABEL": "Blocksize_Testnet_Main",
+    "VERSION": "0.708.20306",
+}
+
+
+class TestClusterNodesMetrics(unittest.TestCase):
+    @patch.dict("os.environ", ENV)
+    def test_gossip_metrics_absent_when_disabled(self):
+        """Without CLUSTER_NODES_INTERVAL no gossip series is exposed, not even a default 0."""
+        exporter = SolanaExporter(config_source="fromEnv")
+
+        output = generate_latest(exporter.registry).decode()
+        self.assertNotIn("solana_gossip_present", output)
+        self.assertNotIn("solana_cluster_version", output)
+
+    @patch.dict("os.environ", {**ENV, "CLUSTER_NODES_INTERVAL": "300"})
+    def test_update_cluster_nodes(self):
+        """Gossip metrics are refreshed on their own cadence."""
+        exporter = SolanaExporter(config_source="fromEnv")
+        exporter._batched_rpc_call = MagicMock(
+            return_value=[
+                rpc_response([node(IDENTITY, "2.0.1"), node("B", "1.18.0")]),
+                rpc_response(vote_accounts({IDENTITY: 1_000_000_000, "B": 3_000_000_000})),
+            ]
+        )
+
+        exporter._update_cluster_nodes()
+        exporter._update_cluster_nodes()
+
+        exporter._batched_rpc_call.assert_called_once()
+        self.assertEqual(exporter.cluster_nodes.get(), 2)
+        self.assertEqual(exporter.gossip_present.get(), 1)
+        self.assertEqual(exporter.gossip_node_info.get(["2.0.1", "10.0.0.1:8001", "10.0.0.1:8003", ""]), 1)
+        self.assertEqual(exporter.cluster_version_nodes.get(["1.18.0"]), 1)
+        self.assertEqual(exporter.cluster_version_stake.get(["1.18.0"]), 3)
+        self.assertEqual(exporter.version_stake_share.get(), 0.25)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+import logging
+import math
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from solanaexporter.epochBackfill import EpochBackfill, epoch_slot_range, main
+
+VOTE_PUBKEY = "6jJK69aeuLbVnM6nUKnmMMwyQG2rNjKNFrfM459kfAdL"
+VALIDATOR_PUBKEY = "4EKxPYXmBha7ADnZphFFC13RaKNYLZCiQPKuSV8YWRZc"
+
+
+def rpc_response(result=None, error=None):
+    response = MagicMock()
+    response.result = result
+    response.error = error
+    return response
+
+
+class TestEpochBackfill(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.checkpoint_dir = os.path.join(self.tmp_dir.name, "checkpoints")
+        self.output = os.path.join(self.tmp_dir.name, "backfill.npz")
+        self.block_production_calls = []
+        self.failing_block_production = set()
+        self.failing_schedules = set()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def send(self, rpc_url, rpc_requests, logger):
+        method, params = rpc_requests.method, rpc_requests.params
+        if method == "getEpochSchedule":
+            return [rpc_response({"slotsPerEpoch": 100, "firstNormalEpoch": 0, "firstNormalSlot": 0})]
+        if method == "getEpochInfo":
+            return [rpc_response({"epoch": 3, "absoluteSlot": 350})]
+        if method == "getBlockProduction":
+            first_slot = params[0]["range"]["firstSlot"]
+            self.block_production_calls.append(first_slot)
+            if first_slot in self.failing_block_production:
+                return [rpc_response(error={"code": -32602, "message": "Invalid params: firstSlot is too small"})]
+            return [rpc_response({"value": {"byIdentity": {VALIDATOR_PUBKEY: [4, 4 - first_slot // 100]}}})]
+        if method == "getLeaderSchedule":
+            if params[0] in self.failing_schedules:
+                return [rpc_response(error={"code": -32000, "message": "timeout"})]
+            if params[0] < 200:
+                return [rpc_response(None)]
+            return [rpc_response({VALIDATOR_PUBKEY: [0, 1, 50, 51]})]
+        if method == "getVoteAccounts":
+            account = {"votePubkey": VOTE_PUBKEY, "activatedStake": 5_000_000_000, "epochCredits": [[2, 900, 100]]}
+            return [rpc_response({"current": [account], "delinquent": []})]
+        raise AssertionError(f"unexpected method {method}")
+
+    def make_backfill(self, validator_pubkey=VALIDATOR_PUBKEY, vote_pubkey=VOTE_PUBKEY):
+        return EpochBackfill(
+            rpc_url="http://localhost:8899",
+            validator_pubkey=validator_pubkey,
+            vote_pubkey=vote_pubkey,
+            checkpoint_dir=self.checkpoint_dir,
+            logger=logging.getLogger(__name__),
+            concurrency=2,
+        )
+
+    def test_epoch_slot_range(self):
+        """Warmup epochs double in length until the normal epoch length."""
+        schedule = {"slotsPerEpoch": 8192, "firstNormalEpoch": 8, "firstNormalSlot": 8160}
+
+        self.assertEqual(epoch_slot_range(schedule, 0), (0, 31))
+        self.assertEqual(epoch_slot_range(schedule, 1), (32, 95))
+        self.assertEqual(epoch_slot_range(schedule, 8), (8160, 16351))
+        self.assertEqual(epoch_slot_range(schedule, 9), (16352, 24543))
+
+    @patch("solanaexporter.epochBackfill.JsonRPCRequest.send")
+    def test_run_writes_columnar_archive(self, mock_send):
+        """Every epoch becomes one row of the archive."""
+        mock_send.side_effect = self.send
+
+        missing = self.make_backfill().run(1, 5, self.output)
+
+        self.assertEqual(missing, [])
+        archive = np.load(self.output)
+        np.testing.assert_array_equal(archive["epoch"], [1, 2, 3])
+        np.testing.assert_array_equal(archive["fetched"], [True, True, True])
+        np.testing.assert_array_equal(archive["last_slot"], [199, 299, 350])
+        np.testing.assert_array_equal(archive["skipped_slots"], [1, 2, 3])
+        np.testing.assert_array_equal(archive["credits"], [-1, 800, -1])
+        self.assertTrue(math.isnan(archive["activated_stake"][0]))
+        self.assertEqual(archive["activated_stake"][2], 5)
+        np.testing.assert_array_equal(archive["leader_slot_index"], [0, 0, 4, 8])
+
+    @patch("solanaexporter.epochBackfill.JsonRPCRequest.send")
+    def test_run_resumes_from_checkpoints(self, mock_send):
+        """Completed epochs are not fetched again, the running epoch is."""
+        mock_send.side_effect = self.send
+        self.make_backfill().run(1, 3, self.output)
+        self.block_production_calls.clear()
+
+        self.make_backfill().run(1, 3, self.output)
+
+        self.assertEqual(self.block_production_calls, [300])
+        self.assertEqual(
+            sorted(os.listdir(self.checkpoint_dir)),
+            [f"epoch-{epoch}-{VALIDATOR_PUBKEY}-{VOTE_PUBKEY}.json" for epoch in (1, 2)],
+        )
+
+    @patch("solanaexporter.epochBackfill.JsonRPCRequest.send")
+    def test_checkpoints_are_not_shared_between_validators(self, mock_send):
+        """Another validator backfilling into the same directory fetches its own epochs."""
+        mock_send.side_effect = self.send
+        self.make_backfill().run(1, 3, self.output)
+        self.block_production_calls.clear()
+
+        self.make_backfill(validator_pubkey="OtherValidator", vote_pubkey="OtherVote").run(1, 3, self.output)
+
+        self.assertEqual(self.block_production_calls, [100, 200, 300])
+        np.testing.assert_array_equal(np.load(self.output)["leader_slots"], [0, 0, 0])
+
+    @patch("solanaexporter.epochBackfill.JsonRPCRequest.send")
+    def test_failed_epochs_are_marked_missing(self, mock_send):
+        """Epochs outside the node's slot history are written as missing rows and not checkpointed."""
+        mock_send.side_effect = self.send
+        self.failing_block_production = {100}
+
+        missing = self.make_backfill().run(1, 3, self.output)
+
+        self.assertEqual(missing, [1])
+        archive = np.load(self.output)
+        np.testing.assert_array_equal(archive["fetched"], [False, True, True])
+        np.testing.assert_array_equal(archive["skipped_slots"], [-1, 2, 3])
+        self.assertEqual(os.listdir(self.checkpoint_dir), [f"epoch-2-{VALIDATOR_PUBKEY}-{VOTE_PUBKEY}.json"])
+
+        with self.assertRaises(SystemExit) as exit_info:
+            main(
+                [
+                    "--rpc-url=http://localhost:8899",
+                    f"--validator-pubkey={VALIDATOR_PUBKEY}",
+                    f"--vote-pubkey={VOTE_PUBKEY}",
+                    "--start-epoch=1",
+                    "--end-epoch=3",
+                    f"--output={self.output}",
+                    f"--checkpoint-dir={self.checkpoint_dir}",
+                ]
+            )
+        self.assertEqual(exit_info.exception.code, 1)
+
+    @patch("solanaexporter.epochBackfill.JsonRPCRequest.send")
+    def test_failed_leader_schedule_is_retried(self, mock_send):
+        """A failed leader schedule call is flagged and the epoch is fetched again on the next run."""
+        mock_send.side_effect = self.send
+        self.failing_schedules = {200}
+
+        self.assertEqual(self.make_backfill().run(2, 2, self.output), [])
+
+        np.testing.assert_array_equal(np.load(self.output)["leader_schedule_failed"], [True])
+        self.assertEqual(os.listdir(self.checkpoint_dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import gzip
+import logging
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from prometheus_client import generate_latest
+
+from solanaexporter.metricsPusher import MetricsPusher
+from solanaexporter.solanaExporter import SolanaExporter
+
+ENV = {
+    "SOLANA_RPC_URL": "http://localhost:8899",
+    "SOLANA_PUBLIC_RPC_URL": "https://api.testnet.solana.com",
+    "EXPORTER_PORT": "7896",
+    "POLL_INTERVAL": "10",
+    "VOTE_PUBKEY": "6jJK69aeuLbVnM6nUKnmMMwyQG2rNjKNFrfM459kfAdL",
+    "VALIDATOR_PUBKEY": "4EKxPYXmBha7ADnZphFFC13RaKNYLZCiQPKuSV8YWRZc",
+    "LABEL": "Blocksize_Testnet_Main",
+    "VERSION": "0.708.20306",
+}
+
+
+class PushReceiver(ThreadingHTTPServer):
+    """Local stand-in for a Pushgateway recording every accepted push."""
+
+    def __init__(self, failures=0):
+        super().__init__(("127.0.0.1", 0), PushHandler)
+        self.failures = failures
+        self.pushes = []
+        self.attempts = 0
+        self.received = threading.Event()
+
+
+class PushHandler(BaseHTTPRequestHandler):
+    def do_PUT(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.attempts += 1
+        if self.server.failures > 0:
+            self.server.failures -= 1
+            self.send_response(503)
+        else:
+            self.server.pushes.append((self.path, self.headers["Content-Encoding"], gzip.decompress(body)))
+            self.server.received.set()
+            self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestMetricsPusher(unittest.TestCase):
+    def start_receiver(self, failures=0):
+        receiver = PushReceiver(failures=failures)
+        threading.Thread(target=receiver.serve_forever, daemon=True).start()
+        self.addCleanup(receiver.server_close)
+        self.addCleanup(receiver.shutdown)
+        return receiver
+
+    def make_pusher(self, receiver, **kwargs):
+        pusher = MetricsPusher(
+            url=f"http://127.0.0.1:{receiver.server_address[1]}/",
+            job="solana_exporter",
+            instance="Blocksize Testnet",
+            logger=logging.getLogger(__name__),
+            backoff=0.01,
+            **kwargs,
+        )
+        self.addCleanup(pusher.stop)
+        return pusher
+
+    def test_backlog_is_coalesced_into_newest_snapshot(self):
+        """Snapshots queued while the receiver is busy collapse into the newest one."""
+        receiver = self.start_receiver()
+        pusher = self.make_pusher(receiver, max_buffer=2)
+        for poll in range(3):
+            pusher.enqueue(f"solana_slot_number {poll}\n".encode())
+        self.assertEqual(pusher.buffer_depth, 2)
+
+        pusher.start()
+        self.assertTrue(receiver.received.wait(5))
+
+        self.assertEqual(
+            receiver.pushes,
+            [("/metrics/job/solana_exporter/instance/Blocksize%20Testnet", "gzip", b"solana_slot_number 2\n")],
+        )
+        self.assertEqual(pusher.dropped, 2)
+        self.assertEqual(pusher.buffer_depth, 0)
+
+    def test_push_retries_with_backoff(self):
+        receiver = self.start_receiver(failures=2)
+        pusher = self.make_pusher(receiver, max_retries=2)
+
+        self.assertTrue(pusher.push(b"solana_slot_number 1\n"))
+        self.assertEqual(receiver.attempts, 3)
+        self.assertEqual(pusher.pushes, 1)
+        self.assertGreater(pusher.last_latency, 0)
+
+    def test_push_gives_up_after_retries(self):
+        receiver = self.start_receiver(failures=5)
+        pusher = self.make_pusher(receiver, max_retries=1)
+
+        self.assertFalse(pusher.push(b"solana_slot_number 1\n"))
+        self.assertEqual(receiver.attempts, 2)
+        self.assertEqual(pusher.failures, 1)
+
+
+class TestPushMetrics(unittest.TestCase):
+    @patch.dict("os.environ", ENV)
+    def test_push_metrics_absent_without_pushgateway(self):
+        exporter = SolanaExporter(config_source="fromEnv")
+
+        self.assertNotIn("solana_push_", generate_latest(exporter.registry).decode())
+
+    @patch.dict("os.environ", {**ENV, "PUSH_GATEWAY_URL": "http://127.0.0.1:9091"})
+    def test_push_metrics_present_with_pushgateway(self):
+        exporter = SolanaExporter(config_source="fromEnv")
+
+        self.assertIn("solana_push_buffer_depth 0.0", generate_latest(exporter.registry).decode())
+
+
+if __name__ == "__main__":
+    unittest.main()
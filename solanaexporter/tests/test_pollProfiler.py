@@ -0,0 +1,138 @@
+import json
+import logging
+import threading
+import time
+import tracemalloc
+import unittest
+import urllib.error
+import urllib.request
+
+from solanaexporter.pollProfiler import PollProfiler, ProfilingServer
+
+
+def decode_batch():
+    return json.loads(json.dumps([{"result": list(range(2000))} for _ in range(20)]))
+
+
+def update_metrics(batch):
+    return sum(len(response["result"]) for response in batch)
+
+
+class TestPollProfiler(unittest.TestCase):
+    def setUp(self):
+        self.profiler = PollProfiler(logger=logging.getLogger(__name__), sample_interval=0.001)
+
+    def fake_poll(self):
+        """Drive the profiler the way collect_metrics does."""
+        if self.profiler.active:
+            self.profiler.begin_poll()
+        self.profiler.mark("rpc")
+        batch = decode_batch()
+        time.sleep(0.01)
+        self.profiler.mark("update")
+        update_metrics(batch)
+        self.profiler.end_poll()
+
+    def profile(self, polls, mode):
+        result = {}
+        thread = threading.Thread(target=lambda: result.update(report=self.profiler.run(polls, mode, timeout=5)))
+        thread.start()
+        while not self.profiler.active:
+            time.sleep(0.001)
+        for _ in range(polls + 1):
+            self.fake_poll()
+        thread.join()
+        self.assertFalse(self.profiler.active)
+        return result["report"]
+
+    def test_inactive_profiler_does_nothing(self):
+        self.fake_poll()
+        self.assertFalse(self.profiler.active)
+
+    def test_cprofile_report(self):
+        report = self.profile(2, "cprofile")
+
+        self.assertIn("# cprofile profile of 2 collect_metrics poll(s)", report)
+        self.assertIn("decode_batch", report)
+
+    def test_stack_report_is_split_by_phase(self):
+        report = self.profile(1, "stack")
+
+        self.assertIn("# stack profile of 1 collect_metrics poll(s)", report)
+        self.assertIn("rpc;", report)
+        self.assertIn("fake_poll", report)
+
+    def test_tracemalloc_report_per_phase(self):
+        report = self.profile(1, "tracemalloc")
+
+        self.assertIn("## rpc:", report)
+        self.assertIn("## update:", report)
+
+    def test_timeout_with_poll_still_running(self):
+        """A timed out profile is detached and the running poll finishes it without errors."""
+        result = {}
+        thread = threading.Thread(
+            target=lambda: result.update(report=self.profiler.run(1, "tracemalloc", timeout=0.05))
+        )
+        thread.start()
+        while not self.profiler.active:
+            time.sleep(0.001)
+        self.profiler.begin_poll()
+        self.profiler.mark("rpc")
+        thread.join()
+
+        self.assertIn("timed out with a poll still running", result["report"])
+        self.profiler.mark("update")
+        self.profiler.end_poll()
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertFalse(self.profiler.active)
+
+    def test_timeout_between_polls(self):
+        """A profile timing out between polls releases tracemalloc and reports the finished polls."""
+        result = {}
+        thread = threading.Thread(target=lambda: result.update(report=self.profiler.run(2, "tracemalloc", timeout=1)))
+        thread.start()
+        while not self.profiler.active:
+            time.sleep(0.001)
+        self.profiler.begin_poll()
+        self.profiler.mark("rpc")
+        self.profiler.end_poll()
+        thread.join()
+
+        self.assertIn("# tracemalloc profile of 1 collect_metrics poll(s)", result["report"])
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_invalid_requests(self):
+        with self.assertRaises(ValueError):
+            self.profiler.run(1, "perf", timeout=1)
+        with self.assertRaises(ValueError):
+            self.profiler.run(0, "cprofile", timeout=1)
+
+    def test_http_endpoint(self):
+        server = ProfilingServer(("127.0.0.1", 0), self.profiler, poll_timeout=5)
+        server.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        base_url = f"http://127.0.0.1:{server.server_address[1]}/debug/profile"
+
+        result = {}
+
+        def fetch():
+            with urllib.request.urlopen(f"{base_url}?polls=1&mode=cprofile", timeout=10) as response:
+                result["body"] = response.read().decode()
+
+        thread = threading.Thread(target=fetch)
+        thread.start()
+        while not self.profiler.active:
+            time.sleep(0.001)
+        self.fake_poll()
+        thread.join()
+        self.assertIn("cprofile profile of 1", result["body"])
+
+        with self.assertRaises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(f"{base_url}?mode=perf", timeout=10)
+        self.assertEqual(error.exception.code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import logging
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+from prometheus_client import generate_latest
+
+from solanaexporter.referenceTip import ReferenceTipTracker, consensus_tip
+from solanaexporter.solanaExporter import SolanaExporter
+
+
+class TestConsensusTip(unittest.TestCase):
+    def test_outliers_are_dropped(self):
+        """A far-off endpoint does not move the consensus tip."""
+        now = 1_000.0
+        samples = [(5000, now), (5002, now), (4998, now), (90_000, now)]
+
+        tip, endpoints_used = consensus_tip(samples, now)
+
+        self.assertEqual(tip, 5002)
+        self.assertEqual(endpoints_used, 3)
+
+    def test_samples_are_aligned_to_now(self):
+        """Older samples are projected forward by the elapsed slots."""
+        now = 1_000.0
+        samples = [(5000, now - 2.0), (5004, now)]
+
+        tip, _ = consensus_tip(samples, now)
+
+        self.assertEqual(tip, 5005)
+
+    def test_two_endpoints_disagreeing(self):
+        """With two far apart endpoints the lagging one is dropped instead of both."""
+        tip, endpoints_used = consensus_tip([(5000, 0), (5400, 0)], 0)
+
+        self.assertEqual(tip, 5400)
+        self.assertEqual(endpoints_used, 1)
+
+    def test_no_samples(self):
+        self.assertIsNone(consensus_tip([], 1_000.0))
+
+
+class TestReferenceTipTracker(unittest.TestCase):
+    @patch("solanaexporter.referenceTip.requests.post")
+    def test_poll_ignores_failed_endpoints(self, mock_post):
+        """Failing endpoints are skipped and the tip is built from the rest."""
+
+        def post(url, json, timeout):
+            if url == "http://down":
+                raise requests.ConnectionError("down")
+            response = MagicMock()
+            response.json.return_value = {"result": {"http://a": 7000, "http://b": 7001}[url]}
+            return response
+
+        mock_post.side_effect = post
+        tracker = ReferenceTipTracker(["http://a", "http://b", "http://down"], logging.getLogger(__name__))
+
+        tip = tracker.poll()
+
+        self.assertAlmostEqual(tip, 7001, delta=1)
+        self.assertEqual(tracker.endpoints_used, 2)
+        self.assertAlmostEqual(tracker.current_tip(), 7001, delta=1)
+        self.assertIsNone(tracker.current_tip(now=time.time() + 60))
+
+    @patch("os.environ", new_callable=lambda: {})
+    @patch("requests.post")
+    def test_slot_lag_uses_reference_tip(self, mock_post, mock_env):
+        """Slot lag is computed against the reference tip instead of the local epoch info."""
+        mock_env.update(
+            {
+                "SOLANA_RPC_URL": "http://localhost:8899",
+                "SOLANA_PUBLIC_RPC_URL": "https://api.testnet.solana.com",
+                "EXPORTER_PORT": "7896",
+                "POLL_INTERVAL": "10",
+                "VOTE_PUBKEY": "6jJK69aeuLbVnM6nUKnmMMwyQG2rNjKNFrfM459kfAdL",
+                "VALIDATOR_PUBKEY": "4EKxPYXmBha7ADnZphFFC13RaKNYLZCiQPKuSV8YWRZc",
+                "LABEL": "Blocksize_Testnet_Main",
+                "VERSION": "0.708.20306",
+                "REFERENCE_RPC_URLS": "http://a, http://b",
+            }
+        )
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = [
+            {"result": 12345},  # getSlot
+            {"result": {"value": 100_000_000_000}},  # getBalance
+            {"result": {"current": [], "delinquent": []}},  # getVoteAccounts
+            {"result": {"absoluteSlot": 12345, "epoch": 713}},  # getEpochInfo
+            {"result": {}},  # getLeaderSchedule
+            {"result": {"value": {"byIdentity": {}}}},  # getBlockProduction
+            {"result": "ok"},  # getHealth
+        ]
+
+        exporter = SolanaExporter(config_source="fromEnv")
+        with patch.object(exporter.reference_tip_tracker, "current_tip", return_value=12545.2):
+            exporter.collect_metrics()
+
+        self.assertEqual(exporter.slot_lag.get(), 200)
+        self.assertEqual(exporter.sync_status.get(), 0)
+        self.assertEqual(exporter.reference_tip.get(), 12545)
+
+    @patch.dict(
+        "os.environ",
+        {
+            "SOLANA_RPC_URL": "http://localhost:8899",
+            "SOLANA_PUBLIC_RPC_URL": "https://api.testnet.solana.com",
+            "EXPORTER_PORT": "7896",
+            "POLL_INTERVAL": "10",
+            "VOTE_PUBKEY": "6jJK69aeuLbVnM6nUKnmMMwyQG2rNjKNFrfM459kfAdL",
+            "VALIDATOR_PUBKEY": "4EKxPYXmBha7ADnZphFFC13RaKNYLZCiQPKuSV8YWRZc",
+            "LABEL": "Blocksize_Testnet_Main",
+            "VERSION": "0.708.20306",
+        },
+    )
+    def test_reference_metrics_absent_when_disabled(self):
+        """Without reference endpoints no reference tip series is exposed."""
+        exporter = SolanaExporter(config_source="fromEnv")
+
+        self.assertNotIn("solana_reference_", generate_latest(exporter.registry).decode())
+
+
+if __name__ == "__main__":
+    unittest.main()
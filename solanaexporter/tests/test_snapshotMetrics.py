@@ -0,0 +1,99 @@
+import unittest
+
+from prometheus_client import CollectorRegistry, generate_latest
+
+from solanaexporter.snapshotMetrics import SnapshotCollector
+
+
+class TestSnapshotCollector(unittest.TestCase):
+    def setUp(self):
+        self.registry = CollectorRegistry()
+        self.metrics = SnapshotCollector(registry=self.registry)
+        self.slot = self.metrics.gauge("solana_slot_number", "Current slot number")
+        self.distance = self.metrics.gauge("solana_vote_distance", "Vote distance")
+        self.stake = self.metrics.gauge("solana_delegator_stake", "Stake per delegator", labelnames=["delegator"])
+        self.build = self.metrics.info("solana_build", "Build information")
+
+    def scrape(self):
+        return generate_latest(self.registry).decode()
+
+    def test_scrapes_only_see_published_values(self):
+        """Staged updates stay invisible until the whole snapshot is published."""
+        self.slot.set(100)
+        self.distance.set(2)
+        self.metrics.publish()
+
+        self.slot.set(200)
+        self.assertIn("solana_slot_number 100.0", self.scrape())
+        self.assertEqual(self.slot.get(), 200)
+
+        self.distance.set(5)
+        self.metrics.publish()
+        output = self.scrape()
+        self.assertIn("solana_slot_number 200.0", output)
+        self.assertIn("solana_vote_distance 5.0", output)
+
+    def test_unset_gauges_default_to_zero(self):
+        self.assertIn("solana_slot_number 0.0", self.scrape())
+        self.assertEqual(self.slot.get(), 0)
+
+    def test_labeled_family_is_copied_on_write(self):
+        """Changing a labeled family after publishing leaves the published snapshot untouched."""
+        self.stake.set(10, labels=["alice"])
+        self.metrics.publish()
+        published = self.metrics.snapshot["solana_delegator_stake"]
+
+        self.stake.set(20, labels=["bob"])
+        self.metrics.publish()
+
+        self.assertEqual(published, {("alice",): 10.0})
+        output = self.scrape()
+        self.assertIn('solana_delegator_stake{delegator="alice"} 10.0', output)
+        self.assertIn('solana_delegator_stake{delegator="bob"} 20.0', output)
+
+        self.stake.clear()
+        self.metrics.publish()
+        self.assertNotIn("delegator=", self.scrape())
+
+    def test_discard_restores_published_values(self):
+        """Discarded updates never reach a scrape and later polls start from the published snapshot."""
+        self.slot.set(100)
+        self.stake.set(10, labels=["alice"])
+        self.metrics.publish()
+
+        self.slot.set(200)
+        self.stake.set(20, labels=["alice"])
+        self.metrics.discard()
+
+        self.assertEqual(self.slot.get(), 100)
+        self.assertEqual(self.stake.get(["alice"]), 10)
+        self.distance.set(3)
+        self.metrics.publish()
+        output = self.scrape()
+        self.assertIn("solana_slot_number 100.0", output)
+        self.assertIn('solana_delegator_stake{delegator="alice"} 10.0', output)
+
+    def test_info_metric(self):
+        self.build.info({"version": "1.0", "label": "test"})
+        self.metrics.publish()
+
+        self.assertIn('solana_build_info{label="test",version="1.0"} 1.0', self.scrape())
+        self.assertEqual(self.build.get(), {"version": "1.0", "label": "test"})
+
+    def test_counter_metric(self):
+        transactions = self.metrics.counter("solana_vote_transactions", "Vote transactions", labelnames=["status"])
+        transactions.inc(3, labels=["success"])
+        transactions.inc(2, labels=["success"])
+        self.metrics.publish()
+
+        self.assertIn('solana_vote_transactions_total{status="success"} 5.0', self.scrape())
+        with self.assertRaises(ValueError):
+            transactions.inc(-1, labels=["success"])
+
+    def test_label_count_is_checked(self):
+        with self.assertRaises(ValueError):
+            self.stake.set(1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -33,14 +33,14 @@ class TestSolanaExporterIntegration(unittest.TestCase):
         exporter.collect_metrics()
 
         # Validate key metrics after collection
-        self.assertGreater(exporter.slot_number._value.get(), 0, "Slot number should be greater than 0")
-        self.assertGreaterEqual(exporter.balance._value.get(), 0, "Balance should not be negative")
+        self.assertGreater(exporter.slot_number.get(), 0, "Slot number should be greater than 0")
+        self.assertGreaterEqual(exporter.balance.get(), 0, "Balance should not be negative")
         self.assertIn(
-            exporter.health_status._value.get(),
+            exporter.health_status.get(),
             {0, 1},
             "Health status should be either 0 (unhealthy) or 1 (healthy)",
         )
-        self.assertGreaterEqual(exporter.epoch._value.get(), 0, "Epoch should not be negative")
+        self.assertGreaterEqual(exporter.epoch.get(), 0, "Epoch should not be negative")
 
     @patch.dict("os.environ", {}, clear=True)
     def test_get_stake_accounts(self):
@@ -85,7 +85,7 @@ class TestSolanaExporterIntegration(unittest.TestCase):
         exporter.collect_metrics()
 
         # Validate that double_zero_balance is set and greater than 0
-        double_zero_balance = exporter.double_zero_balance._value.get()
+        double_zero_balance = exporter.double_zero_balance.get()
         self.assertIsNotNone(double_zero_balance, "Double zero balance should be set")
         self.assertGreater(double_zero_balance, 0, "Double zero balance should be greater than 0")
 
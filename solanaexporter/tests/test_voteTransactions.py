@@ -0,0 +1,138 @@
+import json
+import logging
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from solanaexporter.solanaExporter import SolanaExporter
+from solanaexporter.voteTransactions import VoteTransactionCounter
+
+VOTE_PUBKEY = "6jJK69aeuLbVnM6nUKnmMMwyQG2rNjKNFrfM459kfAdL"
+
+
+def rpc_response(result=None, error=None):
+    response = MagicMock()
+    response.result = result
+    response.error = error
+    return response
+
+
+class TestVoteTransactionCounter(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cursor_path = os.path.join(self.tmp_dir.name, "cursor.json")
+        # Newest first, like getSignaturesForAddress; every third transaction failed
+        self.history = [
+            {"signature": f"sig{i}", "err": {"InstructionError": [0, "Custom"]} if i % 3 == 0 else None}
+            for i in range(10, 0, -1)
+        ]
+        self.requests = []
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def send(self, rpc_url, rpc_requests, logger):
+        responses = []
+        for request in rpc_requests:
+            _, options = request.params
+            self.requests.append(options)
+            signatures = [entry["signature"] for entry in self.history]
+            start = signatures.index(options["before"]) + 1 if "before" in options else 0
+            end = signatures.index(options["until"]) if "until" in options else len(signatures)
+            responses.append(rpc_response(self.history[start:end][: options["limit"]]))
+        return responses
+
+    def make_counter(self):
+        return VoteTransactionCounter(
+            rpc_url="http://localhost:8899",
+            addresses=[VOTE_PUBKEY],
+            cursor_path=self.cursor_path,
+            logger=logging.getLogger(__name__),
+            page_limit=2,
+        )
+
+    @patch("solanaexporter.voteTransactions.JsonRPCRequest.send")
+    def test_first_poll_only_sets_cursor(self, mock_send):
+        """Without a cursor the history is not paged, counting starts at the newest signature."""
+        mock_send.side_effect = self.send
+
+        counts = self.make_counter().poll()
+
+        self.assertEqual(counts, {VOTE_PUBKEY: (0, 0)})
+        self.assertEqual(self.requests, [{"limit": 1}])
+        with open(self.cursor_path) as cursor_file:
+            self.assertEqual(json.load(cursor_file), {VOTE_PUBKEY: "sig10"})
+
+    @patch("solanaexporter.voteTransactions.JsonRPCRequest.send")
+    def test_poll_counts_only_new_signatures(self, mock_send):
+        """Only signatures newer than the persisted cursor are fetched and counted."""
+        mock_send.side_effect = self.send
+        with open(self.cursor_path, "w") as cursor_file:
+            json.dump({VOTE_PUBKEY: "sig5"}, cursor_file)
+
+        counter = self.make_counter()
+        counts = counter.poll()
+
+        # sig10..sig6 are new, sig9 and sig6 failed
+        self.assertEqual(counts, {VOTE_PUBKEY: (3, 2)})
+        self.assertEqual(
+            self.requests,
+            [
+                {"limit": 2, "until": "sig5"},
+                {"limit": 2, "until": "sig5", "before": "sig9"},
+                {"limit": 2, "until": "sig5", "before": "sig7"},
+            ],
+        )
+        self.assertEqual(counter.cursors, {VOTE_PUBKEY: "sig10"})
+
+        self.requests.clear()
+        self.assertEqual(counter.poll(), {VOTE_PUBKEY: (0, 0)})
+        self.assertEqual(self.requests, [{"limit": 2, "until": "sig10"}])
+
+    @patch("solanaexporter.voteTransactions.JsonRPCRequest.send")
+    def test_failed_poll_keeps_cursor(self, mock_send):
+        mock_send.return_value = [rpc_response(error={"code": -32005, "message": "unhealthy"})]
+        with open(self.cursor_path, "w") as cursor_file:
+            json.dump({VOTE_PUBKEY: "sig5"}, cursor_file)
+
+        counter = self.make_counter()
+
+        self.assertIsNone(counter.poll())
+        self.assertEqual(counter.cursors, {VOTE_PUBKEY: "sig5"})
+
+
+class TestVoteTransactionEndpoint(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.env = {
+            "SOLANA_RPC_URL": "http://localhost:8899",
+            "SOLANA_PUBLIC_RPC_URL": "https://api.testnet.solana.com",
+            "EXPORTER_PORT": "7896",
+            "POLL_INTERVAL": "10",
+            "VOTE_PUBKEY": VOTE_PUBKEY,
+            "VALIDATOR_PUBKEY": "4EKxPYXmBha7ADnZphFFC13RaKNYLZCiQPKuSV8YWRZc",
+            "LABEL": "Blocksize_Testnet_Main",
+            "VERSION": "0.708.20306",
+            "VOTE_TX_CURSOR_PATH": os.path.join(self.tmp_dir.name, "cursor.json"),
+        }
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_signatures_use_public_rpc_by_default(self):
+        """Signature history is not queried from the validator's own RPC, which usually lacks it."""
+        with patch.dict("os.environ", self.env):
+            exporter = SolanaExporter(config_source="fromEnv")
+
+        self.assertEqual(exporter.vote_transaction_counter.rpc_url, "https://api.testnet.solana.com")
+
+    def test_signatures_use_configured_rpc(self):
+        with patch.dict("os.environ", {**self.env, "VOTE_TX_RPC_URL": "http://history:8899"}):
+            exporter = SolanaExporter(config_source="fromEnv")
+
+        self.assertEqual(exporter.vote_transaction_counter.rpc_url, "http://history:8899")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import json
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from exporter.jsonRPCRequest import JsonRPCRequest
+from exporter.jsonRPCResponse import JsonRPCResponse
+
+from solanaexporter.clusterCache import write_json_atomic
+
+DEFAULT_PAGE_LIMIT = 1000
+DEFAULT_MAX_PAGES = 10
+
+
+class VoteTransactionCounter:
+    """Count new transactions of a set of accounts since the last persisted signature.
+
+    Each poll asks ``getSignaturesForAddress`` only for signatures newer than the stored
+    cursor via ``until``, so its cost follows the number of new transactions instead of
+    the account history. Cursors are persisted to ``cursor_path`` and survive restarts.
+    """
+
+    def __init__(
+        self,
+        rpc_url: str,
+        addresses: List[str],
+        cursor_path: str,
+        logger: logging.Logger,
+        page_limit: int = DEFAULT_PAGE_LIMIT,
+        max_pages: int = DEFAULT_MAX_PAGES,
+    ):
+        self.rpc_url = rpc_url
+        self.addresses = addresses
+        self.cursor_path = cursor_path
+        self.logger = logger
+        self.page_limit = page_limit
+        self.max_pages = max_pages
+        self.cursors: Dict[str, str] = self._load_cursors()
+
+    def _load_cursors(self) -> Dict[str, str]:
+        try:
+            with open(self.cursor_path) as cursor_file:
+                cursors = json.load(cursor_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable signature cursor file {self.cursor_path}: {e}")
+            return {}
+        return {address: signature for address, signature in cursors.items() if isinstance(signature, str)}
+
+    def _save_cursors(self) -> None:
+        write_json_atomic(self.cursor_path, self.cursors, prefix=".vote-tx-cursor-")
+
+    def _request(self, address: str, before: Optional[str]) -> JsonRPCRequest:
+        cursor = self.cursors.get(address)
+        # Without a cursor only the newest signature is fetched to start counting from there
+        options = {"limit": self.page_limit if cursor else 1}
+        if cursor:
+            options["until"] = cursor
+        if before:
+            options["before"] = before
+        return JsonRPCRequest("getSignaturesForAddress", params=[address, options])
+
+    def poll(self) -> Optional[Dict[str, Tuple[int, int]]]:
+        """Fetch signatures added since the last poll.
+
+        Returns:
+            The number of new successful and failed transactions per address, or None if
+            the RPC call failed and nothing was counted.
+        """
+        counts: Dict[str, Tuple[int, int]] = {address: (0, 0) for address in self.addresses}
+        newest: Dict[str, str] = {}
+        before: Dict[str, Optional[str]] = {address: None for address in self.addresses}
+        pending = list(self.addresses)
+
+        for _ in range(self.max_pages):
+            if not pending:
+                break
+            rpc_requests = [self._request(address, before[address]) for address in pending]
+            responses: List[JsonRPCResponse] = JsonRPCRequest.send(
+                rpc_url=self.rpc_url, rpc_requests=rpc_requests, logger=self.logger
+            )
+            if not responses or len(responses) != len(rpc_requests):
+                self.logger.error("getSignaturesForAddress batch failed, keeping signature cursors")
+                return None
+
+            next_pending = []
+            for address, response in zip(pending, responses):
+                if response.error or not isinstance(response.result, list):
+                    self.logger.error(f"Error fetching signatures for {address}: {response.error}")
+                    return None
+                signatures = response.result
+                if not signatures:
+                    continue
+                newest.setdefault(address, signatures[0]["signature"])
+                if address not in self.cursors:
+                    continue
+
+                failed = sum(1 for signature in signatures if signature.get("err") is not None)
+                successes, failures = counts[address]
+                counts[address] = (successes + len(signatures) - failed, failures + failed)
+                if len(signatures) == self.page_limit:
+                    before[address] = signatures[-1]["signature"]
+                    next_pending.append(address)
+            pending = next_pending
+
+        if pending:
+            self.logger.warning(
+                f"More than {self.max_pages * self.page_limit} new signatures for {pending}, skipping the rest"
+            )
+
+        if newest:
+            self.cursors.update(newest)
+            try:
+                self._save_cursors()
+            except OSError as e:
+                self.logger.error(f"Failed to persist signature cursors to {self.cursor_path}: {e}")
+        return counts